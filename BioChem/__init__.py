@@ -26,12 +26,30 @@ print(results)
 ```
 """
 
-# Import all modules
-from BioChem.scrapers.admetlab import AdmetLabScraper
-from BioChem.scrapers.knapsack import KnapsackScraper
-from BioChem.scrapers.protox import ProtoxScraper
-from BioChem.scrapers.molsoft import MolsoftScraper
-from BioChem.cheminformatics import ChemAnalyzer
+import importlib
+
+# Public classes are imported on first access (PEP 562), so `import BioChem`
+# does not pull in RDKit, pandas or the scraper dependencies up front
+_LAZY_IMPORTS = {
+    'AdmetLabScraper': 'BioChem.scrapers.admetlab',
+    'KnapsackScraper': 'BioChem.scrapers.knapsack',
+    'ProtoxScraper': 'BioChem.scrapers.protox',
+    'MolsoftScraper': 'BioChem.scrapers.molsoft',
+    'ChemAnalyzer': 'BioChem.cheminformatics',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 # Library version
 __version__ = '1.0.0'
@@ -1,7 +1,84 @@
 import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import numpy as np
+import pandas as pd
 from rdkit import Chem
-from rdkit.Chem import Descriptors, Lipinski, AllChem, Draw
-from typing import List, Dict, Union, Any
+from rdkit.Chem import AllChem, Draw
+from rdkit.Chem.Draw import rdMolDraw2D
+from rdkit.ML.Descriptors.MoleculeDescriptors import MolecularDescriptorCalculator
+from typing import List, Dict, Union, Any, Optional, Tuple
+
+# Output property name -> RDKit descriptor name
+_PROPERTY_DESCRIPTORS = {
+    "MolecularWeight": "MolWt",
+    "LogP": "MolLogP",
+    "TPSA": "TPSA",
+    "NumHDonors": "NumHDonors",
+    "NumHAcceptors": "NumHAcceptors",
+    "NumRotatableBonds": "NumRotatableBonds"
+}
+_DESCRIPTOR_CALCULATOR = MolecularDescriptorCalculator(list(_PROPERTY_DESCRIPTORS.values()))
+
+# Lipinski's Rule of Five: (property, upper limit, violation label)
+_LIPINSKI_RULES = [
+    ("MolecularWeight", 500, "MW > 500"),
+    ("LogP", 5, "LogP > 5"),
+    ("NumHDonors", 5, "H-Donors > 5"),
+    ("NumHAcceptors", 10, "H-Acceptors > 10")
+]
+
+# Below this many items a process pool costs more to start than it saves
+_PARALLEL_PROCESS_MIN = 200
+
+
+@lru_cache(maxsize=8192)
+def _parse_smiles_cached(smiles: str) -> Chem.Mol:
+    """
+    Parse a SMILES string, caching the result so repeated SMILES are parsed once.
+    The returned Mol is shared; copy it with Chem.Mol() before modifying it.
+    """
+    return Chem.MolFromSmiles(smiles)
+
+
+def dedupe_smiles(smiles_list: List[str]) -> Tuple[List[str], List[int]]:
+    """
+    Deduplicate SMILES by canonical form while remembering where each input went.
+    Returns (unique, index_map) so that unique[index_map[i]] belongs to smiles_list[i].
+    Each group is represented by its first-seen input string, not the canonical one,
+    so atom order and caller-side joins are preserved. Unparseable SMILES are kept as-is.
+    """
+    canon_index = {}
+    unique = []
+    index_map = []
+    for smi in smiles_list:
+        mol = _parse_smiles_cached(smi)
+        key = Chem.MolToSmiles(mol) if mol is not None else smi
+        i = canon_index.setdefault(key, len(unique))
+        if i == len(unique):
+            unique.append(smi)
+        index_map.append(i)
+    return unique, index_map
+
+
+def _compute_properties(mol: Chem.Mol) -> Dict[str, Union[float, int]]:
+    """Compute all physicochemical properties of a molecule in one calculator pass."""
+    return dict(zip(_PROPERTY_DESCRIPTORS, _DESCRIPTOR_CALCULATOR.CalcDescriptors(mol)))
+
+
+def _lipinski_profile(props: Dict[str, Union[float, int]]) -> Dict[str, Any]:
+    """Evaluate Lipinski's Rule of Five from precomputed physicochemical properties."""
+    violation_details = [label for name, limit, label in _LIPINSKI_RULES if props[name] > limit]
+    violations = len(violation_details)
+
+    return {
+        "violations": violations,
+        "details": violation_details,
+        "conclusion": "Pass" if violations <= 1 else "Fail"
+    }
+
 
 class ChemAnalyzer:
     """
@@ -10,14 +87,16 @@ class ChemAnalyzer:
     conformer generation, energy minimization, and 2D visualization.
     """
     
-    def __init__(self, smiles: str = None, mol: Chem.Mol = None):
+    def __init__(self, smiles: str = None, mol: Chem.Mol = None, prune_rms_thresh: float = 0.5):
         """
         Initialize the ChemAnalyzer with either a SMILES string or an RDKit Mol object.
+        prune_rms_thresh is the RMSD (in Angstrom) below which embedded conformers are
+        treated as duplicates and dropped; use -1 to keep all conformers.
         """
+        self.prune_rms_thresh = prune_rms_thresh
+        self._hs_added = False
         if smiles:
-            self.mol = Chem.MolFromSmiles(smiles)
-            if self.mol is None:
-                raise ValueError(f"Invalid SMILES string: {smiles}")
+            self.load_smiles(smiles)
         elif mol is not None:
             self.mol = mol
         else:
@@ -25,23 +104,18 @@ class ChemAnalyzer:
 
     def load_smiles(self, smiles: str):
         """Load a molecule from a SMILES string."""
-        self.mol = Chem.MolFromSmiles(smiles)
-        if self.mol is None:
+        mol = _parse_smiles_cached(smiles)
+        if mol is None:
             raise ValueError(f"Invalid SMILES string: {smiles}")
+        self.mol = Chem.Mol(mol)
+        self._hs_added = False
 
     def physicochemical_properties(self) -> Dict[str, Union[float, int]]:
         """Calculate basic physicochemical properties."""
         if not self.mol:
             raise ValueError("No molecule loaded.")
         
-        return {
-            "MolecularWeight": Descriptors.MolWt(self.mol),
-            "LogP": Descriptors.MolLogP(self.mol),
-            "TPSA": Descriptors.TPSA(self.mol),
-            "NumHDonors": Lipinski.NumHDonors(self.mol),
-            "NumHAcceptors": Lipinski.NumHAcceptors(self.mol),
-            "NumRotatableBonds": Lipinski.NumRotatableBonds(self.mol)
-        }
+        return _compute_properties(self.mol)
 
     def lipinski_rule_of_five(self) -> Dict[str, Any]:
         """
@@ -51,51 +125,49 @@ class ChemAnalyzer:
         if not self.mol:
             raise ValueError("No molecule loaded.")
             
-        props = self.physicochemical_properties()
-        
-        violations = 0
-        violation_details = []
-        
-        if props["MolecularWeight"] > 500:
-            violations += 1
-            violation_details.append("MW > 500")
-        if props["LogP"] > 5:
-            violations += 1
-            violation_details.append("LogP > 5")
-        if props["NumHDonors"] > 5:
-            violations += 1
-            violation_details.append("H-Donors > 5")
-        if props["NumHAcceptors"] > 10:
-            violations += 1
-            violation_details.append("H-Acceptors > 10")
-            
-        return {
-            "violations": violations,
-            "details": violation_details,
-            "conclusion": "Pass" if violations <= 1 else "Fail"
-        }
+        return _lipinski_profile(self.physicochemical_properties())
 
-    def generate_conformer(self, num_confs: int = 1, random_seed: int = 42) -> List[int]:
-        """Generate 3D conformers for the loaded molecule."""
+    def generate_conformer(self, num_confs: int = 1, random_seed: int = 42, num_threads: int = 0) -> List[int]:
+        """
+        Generate 3D conformers for the loaded molecule using ETKDGv3.
+        Embedding runs on num_threads RDKit threads (0: all cores) and near-duplicate
+        conformers are pruned using prune_rms_thresh, so fewer than num_confs
+        conformers may be returned.
+        """
         if not self.mol:
             raise ValueError("No molecule loaded.")
         
-        # Add hydrogens first for accurate 3D geometry
-        self.mol = Chem.AddHs(self.mol)
-        conformer_ids = AllChem.EmbedMultipleConfs(
-            self.mol, 
-            numConfs=num_confs, 
-            randomSeed=random_seed
-        )
+        # Add hydrogens first for accurate 3D geometry, unless they are already explicit
+        if any(atom.GetTotalNumHs() for atom in self.mol.GetAtoms()):
+            self.mol = Chem.AddHs(self.mol)
+            self._hs_added = True
+
+        params = AllChem.ETKDGv3()
+        params.randomSeed = random_seed
+        params.numThreads = num_threads
+        params.pruneRmsThresh = self.prune_rms_thresh
+        params.useSmallRingTorsions = True
+
+        conformer_ids = AllChem.EmbedMultipleConfs(self.mol, numConfs=num_confs, params=params)
         return list(conformer_ids)
 
-    def minimize_mmff94(self, max_iters: int = 200) -> List[Dict[str, Any]]:
-        """Perform MMFF94 minimization on all generated conformers."""
+    def minimize_mmff94(self, max_iters: int = 200, num_threads: int = 0) -> List[Dict[str, Any]]:
+        """
+        Perform MMFF94 minimization on all generated conformers.
+        MMFF atom typing and the force field are set up once and shared by all
+        conformers, which are optimized on num_threads RDKit threads (0: all cores).
+        """
         if not self.mol or self.mol.GetNumConformers() == 0:
             self.generate_conformer()
             
         results = []
-        res = AllChem.MMFFOptimizeMoleculeConfs(self.mol, maxIters=max_iters, mmffVariant='MMFF94')
+        mmff_props = AllChem.MMFFGetMoleculeProperties(self.mol, mmffVariant='MMFF94')
+        if mmff_props is None:
+            # Molecule cannot be typed by MMFF; this reports every conformer as not converged
+            res = AllChem.MMFFOptimizeMoleculeConfs(self.mol, numThreads=num_threads, maxIters=max_iters, mmffVariant='MMFF94')
+        else:
+            force_field = AllChem.MMFFGetMoleculeForceField(self.mol, mmff_props)
+            res = AllChem.OptimizeMoleculeConfs(self.mol, force_field, numThreads=num_threads, maxIters=max_iters)
         for conf_id, (not_converged, energy) in enumerate(res):
             results.append({
                 "conformer_id": conf_id,
@@ -104,13 +176,13 @@ class ChemAnalyzer:
             })
         return results
 
-    def minimize_uff(self, max_iters: int = 200) -> List[Dict[str, Any]]:
-        """Perform UFF minimization on all generated conformers."""
+    def minimize_uff(self, max_iters: int = 200, num_threads: int = 0) -> List[Dict[str, Any]]:
+        """Perform UFF minimization on all generated conformers on num_threads RDKit threads (0: all cores)."""
         if not self.mol or self.mol.GetNumConformers() == 0:
             self.generate_conformer()
             
         results = []
-        res = AllChem.UFFOptimizeMoleculeConfs(self.mol, maxIters=max_iters)
+        res = AllChem.UFFOptimizeMoleculeConfs(self.mol, numThreads=num_threads, maxIters=max_iters)
         for conf_id, (not_converged, energy) in enumerate(res):
             results.append({
                 "conformer_id": conf_id,
@@ -145,8 +217,8 @@ class ChemAnalyzer:
         if not self.mol:
             raise ValueError("No molecule loaded.")
         
-        # Remove hydrogens for clearer 2D drawing if they were explicitly added
-        display_mol = Chem.RemoveHs(self.mol)
+        # Remove hydrogens for clearer 2D drawing if they were added for 3D embedding
+        display_mol = Chem.RemoveHs(self.mol) if self._hs_added else Chem.Mol(self.mol)
         
         # Ensure 2D coordinates are present
         AllChem.Compute2DCoords(display_mol)
@@ -156,56 +228,147 @@ class ChemAnalyzer:
     # --- Batch Operations ---
     
     @staticmethod
-    def batch_predict_properties(smiles_list: List[str]) -> List[Dict[str, Any]]:
-        """Batch compute physicochemical properties and Lipinski profiling."""
-        results = []
-        for smi in smiles_list:
-            try:
-                analyzer = ChemAnalyzer(smiles=smi)
-                props = analyzer.physicochemical_properties()
-                lipinski = analyzer.lipinski_rule_of_five()
-                results.append({
-                    "smiles": smi,
-                    "properties": props,
-                    "lipinski": lipinski,
-                    "error": None
-                })
-            except Exception as e:
-                results.append({"smiles": smi, "error": str(e)})
-        return results
+    def batch_predict_properties(smiles_list: List[str], n_jobs: int = 1) -> pd.DataFrame:
+        """
+        Batch compute physicochemical properties and Lipinski profiling.
+        Returns one row per SMILES with a column per property, "lipinski_violations",
+        "lipinski_pass" and "error" (None for valid SMILES, NaN properties otherwise).
+        Duplicate SMILES are computed once; rows keep the input SMILES and order.
+        Runs serially by default; n_jobs > 1 (or None for all CPUs) spreads large batches
+        over worker processes. On spawn platforms (Windows, macOS) the calling script must
+        then be protected by an `if __name__ == "__main__":` guard.
+        """
+        unique, index_map = dedupe_smiles(smiles_list)
+        unique_outputs = _parallel_map(_predict_properties_one, n_jobs, unique)
+        outputs = [unique_outputs[i] for i in index_map]
+
+        values = np.full((len(smiles_list), len(_PROPERTY_DESCRIPTORS)), np.nan)
+        errors = [None] * len(smiles_list)
+        for i, (row, error) in enumerate(outputs):
+            if error is None:
+                values[i] = row
+            else:
+                errors[i] = error
+
+        df = pd.DataFrame(values, columns=list(_PROPERTY_DESCRIPTORS))
+        df.insert(0, "smiles", list(smiles_list))
+
+        valid = np.array([error is None for error in errors], dtype=bool)
+        violations = sum((df[name].to_numpy() > limit).astype(np.int64) for name, limit, _ in _LIPINSKI_RULES)
+        df["lipinski_violations"] = pd.Series(violations, dtype="Int64").mask(~valid)
+        df["lipinski_pass"] = valid & (violations <= 1)
+        df["error"] = pd.Series(errors, dtype=object, index=df.index)
+        return df
+
+    @staticmethod
+    def batch_minimize(smiles_list: List[str], method: str = "mmff94", save_dir: str = None,
+                       n_jobs: int = None) -> List[Dict[str, Any]]:
+        """
+        Batch perform conformer generation, minimization, and optionally save SDF files.
+        Duplicate SMILES are minimized once and share the SDF file of their first occurrence.
+        SMILES are spread over n_jobs worker threads (default: all CPUs, 1 runs serially),
+        which works because RDKit releases the GIL during embedding and minimization.
+        Each worker runs RDKit single-threaded, so the thread count stays at n_jobs.
+        """
+        save_path = None
+        if save_dir:
+            os.makedirs(save_dir, exist_ok=True)
+            save_path = pathlib.Path(save_dir)
+
+        unique, index_map = dedupe_smiles(smiles_list)
+        # File numbering follows the position of each molecule's first occurrence
+        first_index = {}
+        for i, j in enumerate(index_map):
+            first_index.setdefault(j, i)
+
+        unique_results = _parallel_map(
+            _minimize_one, n_jobs,
+            unique, [first_index[j] for j in range(len(unique))], repeat(method), repeat(save_path),
+            executor_cls=ThreadPoolExecutor
+        )
+        return [{**unique_results[j], "smiles": smi} for smi, j in zip(smiles_list, index_map)]
 
     @staticmethod
-    def batch_minimize(smiles_list: List[str], method: str = "mmff94", save_dir: str = None) -> List[Dict[str, Any]]:
-        """Batch perform conformer generation, minimization, and optionally save SDF files."""
+    def batch_generate_2d_images(smiles_list: List[str], out_dir: str,
+                                 size: tuple = (300, 300)) -> List[Dict[str, Any]]:
+        """
+        Batch generate 2D drawings and save them as out_dir/mol_<n>.png.
+        A single Cairo drawer is reused for all molecules instead of one per image.
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        drawer = rdMolDraw2D.MolDraw2DCairo(size[0], size[1])
+
         results = []
-        if save_dir and not os.path.exists(save_dir):
-            os.makedirs(save_dir)
-            
         for i, smi in enumerate(smiles_list):
             try:
-                analyzer = ChemAnalyzer(smiles=smi)
-                analyzer.generate_conformer(num_confs=1)
-                
-                if method.lower() == "mmff94":
-                    min_res = analyzer.minimize_mmff94()
-                elif method.lower() == "uff":
-                    min_res = analyzer.minimize_uff()
-                else:
-                    raise ValueError(f"Unknown minimization method: {method}")
-                    
-                output = {
-                    "smiles": smi,
-                    "minimization_results": min_res,
-                    "error": None
-                }
-                
-                if save_dir:
-                    filepath = os.path.join(save_dir, f"mol_{i+1}.sdf")
-                    analyzer.save_conformer(filepath, file_format="sdf")
-                    output["saved_file"] = filepath
-                    
-                results.append(output)
+                mol = _parse_smiles_cached(smi)
+                if mol is None:
+                    raise ValueError(f"Invalid SMILES string: {smi}")
+
+                # Compute2DCoords modifies the molecule, so draw a copy of the cached one
+                display_mol = Chem.Mol(mol)
+                AllChem.Compute2DCoords(display_mol)
+
+                drawer.ClearDrawing()
+                drawer.DrawMolecule(display_mol)
+                drawer.FinishDrawing()
+
+                filepath = os.path.join(out_dir, f"mol_{i+1}.png")
+                drawer.WriteDrawingText(filepath)
+                results.append({"smiles": smi, "saved_file": filepath, "error": None})
             except Exception as e:
                 results.append({"smiles": smi, "error": str(e)})
-                
+
         return results
+
+
+def _parallel_map(func, n_jobs: int, items: List[Any], *args, executor_cls=ProcessPoolExecutor) -> List[Any]:
+    """Map func over items (and extra iterables) in a process or thread pool, keeping input order."""
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(items))
+    if n_jobs <= 1 or (executor_cls is ProcessPoolExecutor and len(items) < _PARALLEL_PROCESS_MIN):
+        return list(map(func, items, *args))
+
+    chunksize = max(1, len(items) // (4 * n_jobs))
+    with executor_cls(max_workers=n_jobs) as executor:
+        return list(executor.map(func, items, *args, chunksize=chunksize))
+
+
+def _predict_properties_one(smi: str) -> Tuple[Optional[Tuple[float, ...]], Optional[str]]:
+    """Compute the descriptor values for one SMILES (batch worker), as (values, error)."""
+    try:
+        mol = _parse_smiles_cached(smi)
+        if mol is None:
+            raise ValueError(f"Invalid SMILES string: {smi}")
+        return _DESCRIPTOR_CALCULATOR.CalcDescriptors(mol), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _minimize_one(smi: str, index: int, method: str, save_path: Optional[pathlib.Path]) -> Dict[str, Any]:
+    """Generate, minimize and optionally save one conformer for a SMILES (batch worker)."""
+    try:
+        analyzer = ChemAnalyzer(smiles=smi)
+        # Parallelism comes from the batch's thread pool, so RDKit itself stays on one thread
+        analyzer.generate_conformer(num_confs=1, num_threads=1)
+
+        if method.lower() == "mmff94":
+            min_res = analyzer.minimize_mmff94(num_threads=1)
+        elif method.lower() == "uff":
+            min_res = analyzer.minimize_uff(num_threads=1)
+        else:
+            raise ValueError(f"Unknown minimization method: {method}")
+
+        output = {
+            "smiles": smi,
+            "minimization_results": min_res,
+            "error": None
+        }
+
+        if save_path:
+            filepath = str(save_path / f"mol_{index+1}.sdf")
+            analyzer.save_conformer(filepath, file_format="sdf")
+            output["saved_file"] = filepath
+
+        return output
+    except Exception as e:
+        return {"smiles": smi, "error": str(e)}
@@ -11,10 +11,28 @@ Available modules:
 - molsoft: Retrieves molecular property data from Molsoft
 """
 
-from BioChem.scrapers.admetlab import AdmetLabScraper
-from BioChem.scrapers.knapsack import KnapsackScraper
-from BioChem.scrapers.protox import ProtoxScraper
-from BioChem.scrapers.molsoft import MolsoftScraper
+import importlib
+
+# Scraper classes are imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    'AdmetLabScraper': 'BioChem.scrapers.admetlab',
+    'KnapsackScraper': 'BioChem.scrapers.knapsack',
+    'ProtoxScraper': 'BioChem.scrapers.protox',
+    'MolsoftScraper': 'BioChem.scrapers.molsoft',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'AdmetLabScraper',
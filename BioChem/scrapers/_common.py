@@ -0,0 +1,262 @@
+"""
+BioChem.scrapers._common - Shared helpers for the scraper modules
+
+This internal module holds the HTTP plumbing that all scrapers have in common,
+plus the cached SMILES to MolBlock conversion used by the Molsoft and ProTox
+scrapers.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Optional
+
+import requests
+from bs4.builder import builder_registry
+from rdkit import Chem
+from rdkit.Chem import AllChem
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and not available on Windows), asyncio's own loop is used
+    uvloop = None
+
+
+# Below this many unique SMILES, MolBlocks are converted without a process pool
+PARALLEL_MOLBLOCK_MIN = 200
+
+# Resolved once at import instead of on every BeautifulSoup(..., "lxml") call.
+# The class (not an instance) is shared, so each parse still gets its own builder.
+LXML_BUILDER = builder_registry.lookup("lxml")
+
+
+def build_session(max_workers: int, session: requests.Session = None) -> requests.Session:
+    """
+    Create an HTTP session with pooled keep-alive connections and retries.
+    
+    Args:
+        max_workers (int): Number of workers sharing the session, used to size the pool.
+        session (requests.Session, optional): Existing session (e.g. a cached session)
+            to configure instead of creating a new one.
+        
+    Returns:
+        requests.Session: Session with an HTTPAdapter mounted for http:// and https://.
+    """
+    if session is None:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=max_workers,
+        pool_maxsize=max_workers * 2,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def submit_bounded(executor, func, items, limit: int, on_result):
+    """
+    Run func(item) for every item on an executor with at most `limit` futures in flight.
+    
+    Items are submitted lazily, so memory stays proportional to `limit` rather
+    than to the number of items.
+    
+    Args:
+        executor (concurrent.futures.Executor): Executor that runs the calls.
+        func (callable): Function called with a single item.
+        items (iterable): Items to process.
+        limit (int): Maximum number of submitted, unfinished calls.
+        on_result (callable): Called with each result as soon as it completes.
+    """
+    in_flight = set()
+    for item in items:
+        if len(in_flight) >= limit:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                on_result(future.result())
+        in_flight.add(executor.submit(func, item))
+
+    for future in as_completed(in_flight):
+        on_result(future.result())
+
+
+def decode_text(response) -> str:
+    """
+    Decode a response body with its declared charset, falling back to UTF-8.
+    
+    Unlike response.text, this never runs charset detection over the body.
+    
+    Args:
+        response (requests.Response or httpx.Response): Completed response.
+        
+    Returns:
+        str: Decoded body; undecodable bytes are replaced.
+    """
+    if hasattr(response, "charset_encoding"):  # httpx
+        encoding = response.charset_encoding
+    else:
+        encoding = response.encoding
+    try:
+        return response.content.decode(encoding or "utf-8", errors="replace")
+    except LookupError:  # Unknown charset name in the Content-Type header
+        return response.content.decode("utf-8", errors="replace")
+
+
+def build_async_client(max_workers: int, max_connections: Optional[int] = None, **kwargs):
+    """
+    Create an HTTP/2 async client for the scrapers' async mode.
+    
+    Args:
+        max_workers (int): Number of concurrent requests, used to size the pool.
+        max_connections (int, optional): Cap on open connections. Default None
+            (four per worker).
+        **kwargs: Extra keyword arguments passed to httpx.AsyncClient.
+        
+    Returns:
+        httpx.AsyncClient: Client with HTTP/2 enabled and a 30 s default timeout.
+        
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("async_mode requires httpx, install it with: pip install BioChem[async]")
+
+    # The scrapers log to the root logger at INFO, where httpx would print a line per request
+    for name in ("httpx", "httpcore"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    kwargs.setdefault("timeout", 30)
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=max_connections or max_workers * 4,
+            max_keepalive_connections=max_workers
+        ),
+        **kwargs
+    )
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on a fresh event loop.
+    
+    uvloop's libuv-based loop is used when it is installed, which lowers the
+    per-request overhead of the async scrapers; otherwise asyncio.run() is used.
+    
+    Args:
+        coro (coroutine): Coroutine to run.
+        
+    Returns:
+        Any: The coroutine's result.
+    """
+    if uvloop:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+async def gather_bounded(func, items, limit: int, on_result):
+    """
+    Await func(item) for every item with at most `limit` calls in flight.
+    
+    A fixed set of `limit` workers pulls items from one shared iterator, so
+    memory stays proportional to `limit` rather than to the number of items.
+    A failing call does not stop the others; once every item has been
+    processed, the first exception raised is re-raised.
+    
+    Args:
+        func (callable): Coroutine function called with a single item.
+        items (iterable): Items to process.
+        limit (int): Maximum number of concurrent calls.
+        on_result (callable): Called with each result as soon as it completes.
+    """
+    items = iter(items)
+    errors = []
+
+    async def worker():
+        # Workers share one event loop thread, so next() never races
+        for item in items:
+            try:
+                result = await func(item)
+            except Exception as e:
+                errors.append(e)
+                continue
+            on_result(result)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, limit))))
+    if errors:
+        raise errors[0]
+
+
+@lru_cache(maxsize=4096)
+def smiles_to_molblock(smiles: str, compute_2d: bool = False) -> str:
+    """
+    Convert SMILES to a MolBlock, caching the result so repeated SMILES are converted once.
+    
+    Args:
+        smiles (str): Valid SMILES string.
+        compute_2d (bool, optional): Compute 2D coordinates explicitly before writing
+            the MolBlock. Default False.
+        
+    Returns:
+        str: MolBlock representation of the SMILES.
+        
+    Raises:
+        ValueError: If SMILES is invalid.
+    """
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        raise ValueError(f"Invalid SMILES: {smiles}")
+    if compute_2d:
+        AllChem.Compute2DCoords(mol)
+    return Chem.MolToMolBlock(mol)
+
+
+def _molblock_or_none(smiles: str, compute_2d: bool) -> Optional[str]:
+    """MolBlock for one SMILES (process pool worker), or None if the SMILES is invalid."""
+    try:
+        return smiles_to_molblock(smiles, compute_2d)
+    except ValueError:
+        return None
+
+
+def precompute_molblocks(smiles_list, compute_2d: bool = False,
+                         n_jobs: Optional[int] = 1) -> Dict[str, Optional[str]]:
+    """
+    Convert every unique SMILES to a MolBlock up front so HTTP workers only look them up.
+    
+    Conversion runs in the calling process unless n_jobs asks for more. Then
+    large batches are converted in a process pool, since RDKit's 2D coordinate
+    generation is CPU-bound and does not scale across threads. Small batches
+    stay in the calling process, where spawning workers would cost more than
+    it saves. If the pool breaks, conversion falls back to the calling process.
+    
+    Args:
+        smiles_list (iterable): SMILES to convert.
+        compute_2d (bool, optional): Passed on to smiles_to_molblock. Default False.
+        n_jobs (int, optional): Number of worker processes, None for all cores. Default 1
+            (no pool). On spawn platforms (Windows, macOS) values above 1 require the
+            calling script to be protected by an `if __name__ == "__main__":` guard.
+        
+    Returns:
+        dict: Mapping of SMILES to MolBlock; invalid SMILES map to None so the
+            workers convert them again and report the error.
+    """
+    unique = list(dict.fromkeys(smiles_list))
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(unique))
+    if n_jobs <= 1 or len(unique) < PARALLEL_MOLBLOCK_MIN:
+        return {smiles: _molblock_or_none(smiles, compute_2d) for smiles in unique}
+
+    chunksize = max(1, len(unique) // (4 * n_jobs))
+    try:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            return dict(zip(unique, executor.map(_molblock_or_none, unique, repeat(compute_2d), chunksize=chunksize)))
+    except BrokenProcessPool:
+        return {smiles: _molblock_or_none(smiles, compute_2d) for smiles in unique}
@@ -29,36 +29,118 @@ print(results)
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin
-from io import StringIO
+from io import BytesIO
 import pandas as pd
 import logging
 from rich.logging import RichHandler
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
 import re
+from typing import Optional
 
-# Setup rich logging
+from BioChem.cheminformatics import dedupe_smiles
+from BioChem.scrapers._common import (
+    LXML_BUILDER, build_async_client, build_session, decode_text, gather_bounded, run_async, submit_bounded
+)
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional, batches are then concatenated with pandas
+    pa = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # selectolax is optional, pages are then parsed with BeautifulSoup
+    HTMLParser = None
+
+# Console shared by log output and progress bars
 console = Console()
 
-# Setup FileHandler for log file
-file_handler = logging.FileHandler("logs.log", encoding="utf-8")
-file_handler.setLevel(logging.INFO)
-file_handler.setFormatter(logging.Formatter(
-    fmt="%(asctime)s - %(levelname)s - %(message)s",
-    datefmt="[%Y-%m-%d %H:%M:%S]"
-))
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    datefmt="[%X]",
-    handlers=[RichHandler(console=console, show_time=True, markup=True), file_handler],
-)
+# Handlers are only attached by configure_logging(), never at import time
 logger = logging.getLogger("admetlab_scraper")
+logger.addHandler(logging.NullHandler())
+
+# Only the tags the scraper reads are parsed out of the ADMETlab pages
+_TOKEN_STRAINER = SoupStrainer('input', attrs={'name': 'csrfmiddlewaretoken'})
+_RESULT_STRAINER = SoupStrainer('div')
+_CSV_RE = re.compile(r'window\.open\(["\'](.*?)\.csv["\']\)')
+
+# Summary card title keyword -> summary key
+_SUMMARY_KEYS = {
+    'success': 'success_molecules',
+    'invalid': 'invalid_molecules',
+    'total': 'total_molecules',
+}
+
+
+def configure_logging(logfile: Optional[str] = None, level: int = logging.INFO):
+    """
+    Attach a rich console handler, and optionally a file handler, to the ADMETlab scraper logger.
+    
+    The library never calls this itself; call it from your script to see the
+    scraper's progress messages.
+    
+    Args:
+        logfile (str, optional): Path of a log file to write as well. Default None (console only).
+        level (int, optional): Logging level. Default logging.INFO.
+    """
+    rich_handler = RichHandler(console=console, show_time=True, markup=True)
+    rich_handler.setFormatter(logging.Formatter(fmt="%(message)s", datefmt="[%X]"))
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.addHandler(rich_handler)
+
+    if logfile:
+        file_handler = logging.FileHandler(logfile, encoding="utf-8")
+        file_handler.setLevel(level)
+        file_handler.setFormatter(logging.Formatter(
+            fmt="%(asctime)s - %(levelname)s - %(message)s",
+            datefmt="[%Y-%m-%d %H:%M:%S]"
+        ))
+        logger.addHandler(file_handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+def _to_arrow(df):
+    """Convert a batch DataFrame to an Arrow table, or return it unchanged when that is not possible."""
+    if pa is None:
+        return df
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):  # e.g. a column mixing numbers and text
+        return df
+
+
+def _assemble_batches(results):
+    """
+    Combine batch results (Arrow tables and/or DataFrames) into one DataFrame.
+    
+    Arrow is used when every batch converted and the schemas can be merged;
+    otherwise (e.g. a column read as float in one batch and text in another)
+    the batches are combined with pd.concat, which falls back to object columns.
+    """
+    if not results:
+        return pd.DataFrame()
+
+    if pa is not None and all(isinstance(result, pa.Table) for result in results):
+        try:
+            combined = pa.concat_tables(results, promote_options="permissive")
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):  # TypeError: pyarrow < 14
+            pass
+        else:
+            return combined.to_pandas(split_blocks=True, self_destruct=True)
+
+    frames = [result.to_pandas() if pa is not None and isinstance(result, pa.Table) else result
+              for result in results]
+    return pd.concat(frames, ignore_index=True)
 
 
 class AdmetLabScraper:
@@ -67,26 +149,36 @@ class AdmetLabScraper:
     
     This class provides functionality to submit SMILES to ADMETlab
     and get ADMET property prediction results in DataFrame format.
+    A single HTTP session and CSRF token are shared by all batches. With
+    async_mode enabled, batches are sent concurrently from one asyncio event loop
+    over an HTTP/2 httpx client instead of a thread pool.
+    
+    The HTTP session and worker thread pool live as long as the scraper and are
+    reused by every run() call; call close() (or use the scraper as a context
+    manager) to release them.
     
     Attributes:
         BASE_URL (str): Base URL of ADMETlab.
         INDEX_URL (str): URL of the main ADMETlab Screening page.
         POST_URL (str): URL endpoint for submitting SMILES requests.
-        max_workers (int): Maximum number of thread workers for parallel processing.
+        max_workers (int): Maximum number of thread workers (or concurrent batches in async mode).
         max_batch_size (int): Maximum number of SMILES in one batch.
+        async_mode (bool): Whether batches are processed with httpx and asyncio.
     """
     
     BASE_URL = "https://admetlab3.scbdd.com"
     INDEX_URL = f"{BASE_URL}/server/screening"
     POST_URL = f"{BASE_URL}/server/screeningCal"
 
-    def __init__(self, max_workers: int = 4, max_batch_size: int = 100):
+    def __init__(self, max_workers: int = 4, max_batch_size: int = 100, async_mode: bool = False):
         """
         Initialize AdmetLabScraper.
         
         Args:
             max_workers (int, optional): Maximum number of thread workers. Default 4.
             max_batch_size (int, optional): Maximum number of SMILES in one batch. Default 100.
+            async_mode (bool, optional): Process batches with httpx and asyncio instead of
+                threads. Requires the 'async' extra (httpx[http2]). Default False.
             
         Raises:
             ValueError: If max_batch_size is not in the range 1-100.
@@ -98,12 +190,35 @@ class AdmetLabScraper:
 
         self.max_workers = max_workers
         self.max_batch_size = max_batch_size
+        self.async_mode = async_mode
+
+        self._session = build_session(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="admetlab")
+        self._token = None
+        self._token_lock = threading.Lock()
+        self._async_token = None
+        self._async_token_lock = None
+
+    def close(self):
+        """
+        Close the HTTP session and shut down the worker thread pool.
+        """
+        self._session.close()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
 
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _get_csrf_token(self, session):
         """
         Get CSRF token from the ADMETlab page.
         
+        The token is read from the csrftoken cookie set on a HEAD request. The
+        screening page is only downloaded and parsed if the cookie is missing.
+        
         Args:
             session (requests.Session): Active HTTP session.
             
@@ -113,91 +228,192 @@ class AdmetLabScraper:
         Raises:
             ValueError: If CSRF token is not found.
         """
+        session.head(self.INDEX_URL, verify=False)
+        token = session.cookies.get('csrftoken')
+        if token:
+            return token
+
         response = session.get(self.INDEX_URL, verify=False)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        token_input = soup.find('input', {'name': 'csrfmiddlewaretoken'})
-        if not token_input:
+        return self._parse_csrf_token(decode_text(response))
+
+    def _parse_csrf_token(self, html):
+        """
+        Extract the CSRF token from the ADMETlab screening page.
+        
+        Args:
+            html (str): HTML content of the screening page.
+            
+        Returns:
+            str: The CSRF token.
+            
+        Raises:
+            ValueError: If CSRF token is not found.
+        """
+        if HTMLParser:
+            token_input = HTMLParser(html).css_first('input[name="csrfmiddlewaretoken"]')
+            token = token_input.attributes.get('value') if token_input else None
+        else:
+            soup = BeautifulSoup(html, builder=LXML_BUILDER, parse_only=_TOKEN_STRAINER)
+            token_input = soup.find('input', {'name': 'csrfmiddlewaretoken'})
+            token = token_input.get('value') if token_input else None
+        if not token:
             raise ValueError("CSRF token not found.")
-        return token_input['value']
+        return token
 
-    def _submit_smiles(self, session, smiles_text, token):
+    def _get_token(self, stale_token=None):
         """
-        Submit SMILES to ADMETlab.
+        Get the cached CSRF token, fetching it on first use.
+        
+        Args:
+            stale_token (str, optional): Token rejected by the server. If it is still
+                the cached one, a fresh token is fetched.
+            
+        Returns:
+            str: Valid CSRF token.
+        """
+        with self._token_lock:
+            if self._token is None or self._token == stale_token:
+                if stale_token:
+                    # Drop the rejected csrftoken cookie so a new one is issued
+                    self._session.cookies.clear()
+                self._token = self._get_csrf_token(self._session)
+            return self._token
+
+    def _build_submission(self, smiles_text, token):
+        """
+        Build the headers and form data for submitting SMILES to ADMETlab.
         
         Args:
-            session (requests.Session): Active HTTP session.
             smiles_text (str): SMILES text to submit.
             token (str): Valid CSRF token.
             
         Returns:
-            requests.Response: HTTP response from the submitted request.
+            tuple: (headers, data) dictionaries for the POST request.
         """
         headers = {
             'Referer': self.INDEX_URL,
             'Origin': self.BASE_URL,
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
             'Content-Type': 'application/x-www-form-urlencoded',
+            'X-CSRFToken': token,
         }
         data = {
             'csrfmiddlewaretoken': token,
             'smiles-list': smiles_text,
             'method': '2'
         }
+        return headers, data
+
+    def _submit_smiles(self, session, smiles_text, token):
+        """
+        Submit SMILES to ADMETlab.
+        
+        Args:
+            session (requests.Session): Active HTTP session.
+            smiles_text (str): SMILES text to submit.
+            token (str): Valid CSRF token.
+            
+        Returns:
+            requests.Response: HTTP response from the submitted request.
+        """
+        headers, data = self._build_submission(smiles_text, token)
         return session.post(self.POST_URL, headers=headers, data=data, verify=False)
 
-    def _parse_summary(self, soup):
+    def _submit_with_token(self, session, smiles_text):
+        """
+        Submit SMILES using the cached CSRF token, refreshing it once if rejected.
+        
+        Args:
+            session (requests.Session): Active HTTP session.
+            smiles_text (str): SMILES text to submit.
+            
+        Returns:
+            requests.Response: HTTP response from the submitted request.
+        """
+        token = self._get_token()
+        response = self._submit_smiles(session, smiles_text, token)
+        if response.status_code == 403:
+            # CSRF token expired, fetch a new one and retry once
+            token = self._get_token(stale_token=token)
+            response = self._submit_smiles(session, smiles_text, token)
+        return response
+
+    def _summary_cards(self, html):
+        """
+        Extract the (title, number) texts of the summary cards on a results page.
+        
+        Args:
+            html (str): HTML content of the results page.
+            
+        Returns:
+            list: List of (title, number) string tuples.
+        """
+        cards = []
+        if HTMLParser:
+            for card in HTMLParser(html).css('div.info-card'):
+                title = card.css_first('h5.card-title')
+                number_tag = card.css_first('h6')
+                if title and number_tag:
+                    cards.append((title.text(strip=True), number_tag.text(strip=True)))
+        else:
+            soup = BeautifulSoup(html, builder=LXML_BUILDER, parse_only=_RESULT_STRAINER)
+            for card in soup.select('div.info-card'):
+                title = card.select_one('h5.card-title')
+                number_tag = card.select_one('h6')
+                if title and number_tag:
+                    cards.append((title.get_text(strip=True), number_tag.get_text(strip=True)))
+        return cards
+
+    def _parse_summary(self, html):
         """
         Parse summary of results from the ADMETlab results page.
         
         Args:
-            soup (BeautifulSoup): BeautifulSoup object of the results page.
+            html (str): HTML content of the results page.
             
         Returns:
             dict: Summary of results containing molecule counts.
         """
         summary = {}
-        success = 0
-        invalid = 0
-
-        # Find all card titles
-        cards = soup.find_all('div', class_='info-card')
-
-        for card in cards:
-            title = card.find('h5', class_='card-title')
-            if title:
-                title_text = title.get_text(strip=True).lower()
-                number_tag = card.find('h6')
-                if number_tag:
-                    number = int(number_tag.get_text(strip=True))
-                    if 'success' in title_text:
-                        summary['success_molecules'] = number
-                        success += number
-                    elif 'invalid' in title_text:
-                        summary['invalid_molecules'] = number
-                        invalid += number
-                    elif 'total' in title_text:
-                        summary['total_molecules'] = number
-                        
+
+        for title_text, number_text in self._summary_cards(html):
+            title_text = title_text.lower()
+            key = next((value for keyword, value in _SUMMARY_KEYS.items() if keyword in title_text), None)
+            if key:
+                summary[key] = int(number_text)
+
         return summary
 
-    def _get_csv_url(self, soup):
+    def _get_csv_url(self, html):
         """
         Get the CSV download URL from the ADMETlab results page.
         
         Args:
-            soup (BeautifulSoup): BeautifulSoup object of the results page.
+            html (str): HTML content of the results page.
             
         Returns:
-            str: Complete URL for downloading the CSV results file.
+            str: Complete URL for downloading the CSV results file, or None if not found.
         """
-        scripts = soup.find_all('script')
-        for script in scripts:
-            if script.string:
-                match = re.search(r'window\.open\(["\'](.*?)\.csv["\']\)', script.string)
-                if match:
-                    csv_url = match.group(1) + ".csv"
-                    return urljoin(self.BASE_URL, csv_url)
+        match = _CSV_RE.search(html)
+        return urljoin(self.BASE_URL, match.group(1) + ".csv") if match else None
+
+    def _handle_results_page(self, html, smiles_batch):
+        """
+        Log the batch summary and find the CSV download URL on a results page.
+        
+        Args:
+            html (str): HTML content of the results page.
+            smiles_batch (list): List of SMILES submitted in the batch.
             
+        Returns:
+            str: Complete URL for downloading the CSV results file.
+        """
+        # The summary is only logged, skip parsing it when nobody would see it
+        if logger.isEnabledFor(logging.INFO):
+            summary = self._parse_summary(html)
+            logger.info(f"[green]✔ Batch of {len(smiles_batch)} molecules. Invalid: {summary.get('invalid_molecules')}[/]")
+
+        return self._get_csv_url(html)
 
     def _process_batch(self, smiles_batch):
         """
@@ -209,28 +425,102 @@ class AdmetLabScraper:
         Returns:
             pandas.DataFrame: DataFrame containing results for the SMILES batch.
         """
-        session = requests.Session()
+        session = self._session
         try:
-            token = self._get_csrf_token(session)
             smiles_text = "\r\n".join(smiles_batch)
-            response = self._submit_smiles(session, smiles_text, token)
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            summary = self._parse_summary(soup)
-            logger.info(f"[green]✔ Batch of {len(smiles_batch)} molecules. Invalid: {summary.get('invalid_molecules')}[/]")
-
-            csv_url = self._get_csv_url(soup)
+            response = self._submit_with_token(session, smiles_text)
+            csv_url = self._handle_results_page(decode_text(response), smiles_batch)
             csv_response = session.get(csv_url, verify=False)
-            df = pd.read_csv(StringIO(csv_response.text))
+            df = pd.read_csv(BytesIO(csv_response.content))
             return df
         except Exception as e:
             logger.error(f"[red]✖ Failed to process batch: {e}[/]")
             return pd.DataFrame()
 
+    async def _get_token_async(self, client, stale_token=None):
+        """
+        Async counterpart of _get_token, bound to the httpx client's cookies.
+        
+        Args:
+            client (httpx.AsyncClient): Active async HTTP client.
+            stale_token (str, optional): Token rejected by the server.
+            
+        Returns:
+            str: Valid CSRF token.
+        """
+        async with self._async_token_lock:
+            if self._async_token is None or self._async_token == stale_token:
+                if stale_token:
+                    client.cookies.clear()
+                await client.head(self.INDEX_URL)
+                token = client.cookies.get('csrftoken')
+                if not token:
+                    response = await client.get(self.INDEX_URL)
+                    token = self._parse_csrf_token(decode_text(response))
+                self._async_token = token
+            return self._async_token
+
+    async def _process_batch_async(self, client, smiles_batch):
+        """
+        Process a batch of SMILES with an async HTTP client.
+        
+        Args:
+            client (httpx.AsyncClient): Active async HTTP client.
+            smiles_batch (list): List of SMILES to process.
+            
+        Returns:
+            pandas.DataFrame: DataFrame containing results for the SMILES batch.
+        """
+        try:
+            smiles_text = "\r\n".join(smiles_batch)
+            token = await self._get_token_async(client)
+            headers, data = self._build_submission(smiles_text, token)
+            response = await client.post(self.POST_URL, headers=headers, data=data)
+            if response.status_code == 403:
+                # CSRF token expired, fetch a new one and retry once
+                token = await self._get_token_async(client, stale_token=token)
+                headers, data = self._build_submission(smiles_text, token)
+                response = await client.post(self.POST_URL, headers=headers, data=data)
+
+            csv_url = self._handle_results_page(decode_text(response), smiles_batch)
+            csv_response = await client.get(csv_url)
+            return pd.read_csv(BytesIO(csv_response.content))
+        except Exception as e:
+            logger.error(f"[red]✖ Failed to process batch: {e}[/]")
+            return pd.DataFrame()
+
+    async def _run_async(self, chunks, on_result):
+        """
+        Process all batches concurrently over one HTTP/2 client.
+        
+        Args:
+            chunks (list): List of SMILES batches.
+            on_result (callable): Called with each batch DataFrame as it completes.
+            
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        self._async_token = None
+        self._async_token_lock = asyncio.Lock()
+
+        async with build_async_client(
+            self.max_workers, max_connections=self.max_workers, verify=False, timeout=None
+        ) as client:
+            await gather_bounded(
+                lambda batch: self._process_batch_async(client, batch),
+                chunks, self.max_workers, on_result
+            )
+
     def run(self, smiles_input):
         """
         Run the ADMET data retrieval process for the given SMILES.
         
+        SMILES are deduplicated by canonical form before submission, so the
+        result holds one row per unique molecule rather than one per input:
+        for ["OCC", "CCO"] only "OCC" is submitted and returned. Map inputs to
+        their representative with BioChem.cheminformatics.dedupe_smiles when
+        joining results back to the input list.
+        
         Args:
             smiles_input (str or list): Single SMILES or list of SMILES.
             
@@ -247,6 +537,12 @@ class AdmetLabScraper:
         else:
             raise TypeError("SMILES must be a string or list of strings.")
 
+        # Canonical duplicates are submitted (and returned) only once
+        unique_smiles, _ = dedupe_smiles(smiles_list)
+        if len(unique_smiles) < len(smiles_list):
+            logger.info(f"[cyan]♻ Skipping {len(smiles_list) - len(unique_smiles)} duplicate SMILES[/]")
+        smiles_list = unique_smiles
+
         chunks = [smiles_list[i:i + self.max_batch_size] for i in range(0, len(smiles_list), self.max_batch_size)]
         logger.info(f"[cyan]🔍 Starting scraping of {len(smiles_list)} SMILES in {len(chunks)} batches (max {self.max_batch_size}/batch)...[/]")
 
@@ -265,16 +561,18 @@ class AdmetLabScraper:
 
             task_id = progress.add_task(f"[yellow]⏳ Processing batches... [0/{total}]", total=total)
 
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {executor.submit(self._process_batch, batch): i for i, batch in enumerate(chunks)}
+            def collect(result):
+                if not result.empty:
+                    # Keep finished batches as Arrow tables so the pandas frames can be freed early
+                    results.append(_to_arrow(result))
+                progress.update(task_id, advance=1,
+                                description=f"[yellow]⏳ Processing batches... [{progress.tasks[0].completed}/{total}]")
 
-                for future in as_completed(futures):
-                    result = future.result()
-                    if not result.empty:
-                        results.append(result)
-                    progress.update(task_id, advance=1,
-                        description=f"[yellow]⏳ Processing batches... [{progress.tasks[0].completed}/{total}]")
+            if self.async_mode:
+                run_async(self._run_async(chunks, collect))
+            else:
+                submit_bounded(self._executor, self._process_batch, chunks, 2 * self.max_workers, collect)
 
-        final_df = pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+        final_df = _assemble_batches(results)
         logger.info(f"[bold green]🏁 Done![/] Total successful molecules: {len(final_df)}")
         return final_df 
\ No newline at end of file
@@ -22,14 +22,26 @@ results.to_excel("Ginkgo_Biloba_Data.xlsx", index=False)
 ```
 """
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import quote
+from io import StringIO
+from lxml import etree
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, BarColumn, TimeElapsedColumn, TextColumn
 import logging
+from datetime import timedelta
+from typing import Optional
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional, pages are then always fetched
+    requests_cache = None
+
+from BioChem.scrapers._common import (
+    LXML_BUILDER, build_session, build_async_client, decode_text, gather_bounded, run_async, submit_bounded
+)
 
 # Setup logger
 logging.basicConfig(
@@ -40,6 +52,88 @@ logging.basicConfig(
 )
 log = logging.getLogger("knapsack")
 
+# Only the result tables are parsed by the BeautifulSoup fallback
+_TABLE_STRAINER = SoupStrainer("table")
+
+_MAIN_COLUMNS = ["C_ID", "CAS_ID", "Metabolite", "Molecular_Formula", "Mw", "Organism or InChIKey etc."]
+# Keep every cell as text (e.g. Mw, leading zeros) like the row-by-row parser did
+_MAIN_CONVERTERS = {i: str for i in range(len(_MAIN_COLUMNS))}
+
+_DETAIL_FIELDS = ("InChIKey", "InChICode", "SMILES", "image_url", "Organism")
+_CHUNK_SIZE = 16384
+
+
+def _text(element) -> str:
+    """Text of an lxml element, stripped per text node like BeautifulSoup's get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+def _has_class(element, name: str) -> bool:
+    """Check whether an lxml element carries the given CSS class."""
+    return name in (element.get("class") or "").split()
+
+
+class _DetailPageParser:
+    """
+    Incremental parser for KNApSAcK detail pages.
+    
+    Feed the page in chunks; feed() returns True as soon as every detail field
+    has been seen so the caller can stop parsing the rest of the page.
+    """
+
+    def __init__(self, scraper, cid: str, encoding: str = None):
+        self.scraper = scraper
+        self.detail = scraper._empty_detail(cid)
+        self.pending = set(_DETAIL_FIELDS)
+        self.organism_label_seen = False
+        self.parser = etree.HTMLPullParser(events=("end",), encoding=encoding)
+
+    def feed(self, data) -> bool:
+        """Parse the next chunk (bytes or str); return True once all fields are known."""
+        self.parser.feed(data)
+        return self._read_events()
+
+    def close(self) -> dict:
+        """Finish parsing and return the detail dictionary."""
+        self.parser.close()
+        self._read_events()
+        return self.detail
+
+    def _read_events(self) -> bool:
+        for _, element in self.parser.read_events():
+            if element.tag == "img":
+                if "image_url" in self.pending and element.get("property") == "image" and element.get("src"):
+                    self.detail["image_url"] = f"https://www.knapsackfamily.com{element.get('src')}"
+                    self.pending.discard("image_url")
+            elif element.tag == "tr":
+                self._read_row(element)
+            elif element.tag == "table" and self.organism_label_seen and not _has_class(element, "d3"):
+                # Organism table placed after (not inside) its label row
+                self._set_organisms(element)
+        return not self.pending
+
+    def _read_row(self, row):
+        header = next((th for th in row.iterchildren("th") if _has_class(th, "inf")), None)
+        if header is None or not any(_has_class(table, "d3") for table in row.iterancestors("table")):
+            return
+
+        label = _text(header)
+        if label == "Organism":
+            organism_table = next(row.iter("table"), None)
+            if organism_table is not None:
+                self._set_organisms(organism_table)
+            else:
+                self.organism_label_seen = True
+        elif label in self.pending:
+            td = next(row.iter("td"), None)
+            self.detail[label] = _text(td) if td is not None else None
+            self.pending.discard(label)
+
+    def _set_organisms(self, organism_table):
+        self.detail["Organism"] = self.scraper.parse_organism_table(organism_table)
+        self.pending.discard("Organism")
+        self.organism_label_seen = False
+
 
 class KnapsackScraper:
     """
@@ -47,20 +141,36 @@ class KnapsackScraper:
     
     KnapsackScraper allows searching for metabolites based on various criteria such as
     plant species name, plant family name, molecular formula, or other parameters,
-    and obtaining detailed information about the metabolites found.
+    and obtaining detailed information about the metabolites found. With
+    async_mode enabled, detail pages are fetched concurrently from one asyncio
+    event loop over an HTTP/2 httpx client instead of a thread pool.
+    
+    The HTTP session and worker thread pool live as long as the scraper and are
+    reused by every search() call; call close() (or use the scraper as a context
+    manager) to release them.
     
     Attributes:
         BASE_URL (str): Base URL for KNApSAcK search results.
         DETAIL_URL (str): Base URL for KNApSAcK detail pages.
+        CACHE_EXPIRE_AFTER (datetime.timedelta): How long cached detail pages stay valid.
         search_type (str): Search type (all, name, formula, mass, cid).
         keyword (str): Search keyword.
-        max_workers (int): Maximum number of threads for parallel processing.
+        max_workers (int): Maximum number of threads for parallel processing (or concurrent
+            requests in async mode).
+        async_mode (bool): Whether detail pages are fetched with httpx and asyncio.
+        session (requests.Session): Pooled HTTP session shared by all requests. When a
+            cache_name is given and requests-cache is installed this is a CachedSession
+            backed by SQLite, so detail pages are reused across searches and runs. Search
+            result pages are never cached, since new compounds can appear in them.
     """
     
     BASE_URL = "https://www.knapsackfamily.com/knapsack_core/result.php"
     DETAIL_URL = "https://www.knapsackfamily.com/knapsack_core/information.php?word="
 
-    def __init__(self, search_type: str = "all", keyword: str = "", max_workers: int = 5):
+    CACHE_EXPIRE_AFTER = timedelta(days=30)
+
+    def __init__(self, search_type: str = "all", keyword: str = "", max_workers: int = 5,
+                 async_mode: bool = False, cache_name: Optional[str] = None):
         """
         Initialize KnapsackScraper.
         
@@ -69,10 +179,45 @@ class KnapsackScraper:
                 Default "all".
             keyword (str, optional): Search keyword. Default "".
             max_workers (int, optional): Maximum number of threads for parallel processing. Default 5.
+            async_mode (bool, optional): Fetch detail pages with httpx and asyncio instead of
+                threads. Requires the 'async' extra (httpx[http2]). Default False.
+            cache_name (str, optional): Name of an SQLite cache for detail pages, used when
+                requests-cache is installed (the 'cache' extra). Detail pages fetched in
+                async_mode bypass it. Default None (no caching).
         """
         self.search_type = search_type
         self.keyword = keyword
         self.max_workers = max_workers
+        self.async_mode = async_mode
+        if cache_name and requests_cache:
+            cached = requests_cache.CachedSession(
+                cache_name, backend="sqlite", expire_after=self.CACHE_EXPIRE_AFTER,
+                urls_expire_after={self.BASE_URL: requests_cache.DO_NOT_CACHE},
+            )
+            self.session = build_session(max_workers, session=cached)
+        else:
+            self.session = build_session(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="knapsack")
+
+    def close(self):
+        """
+        Close the HTTP session and shut down the worker thread pool.
+        """
+        self.session.close()
+        self._executor.shutdown(wait=True)
+
+    def clear_cache(self):
+        """
+        Remove all cached pages. Does nothing when caching is disabled.
+        """
+        if hasattr(self.session, "cache"):
+            self.session.cache.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def build_url(self) -> str:
         """
@@ -98,9 +243,9 @@ class KnapsackScraper:
             requests.exceptions.RequestException: If an error occurs while fetching the URL.
         """
         log.debug(f"🔗 Fetching URL: {url}")
-        response = requests.get(url)
+        response = self.session.get(url, timeout=30)
         response.raise_for_status()
-        return response.text
+        return decode_text(response)
 
     def parse_main_table(self, html: str) -> pd.DataFrame:
         """
@@ -112,7 +257,32 @@ class KnapsackScraper:
         Returns:
             pandas.DataFrame: DataFrame containing data from the search results table.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        try:
+            tables = pd.read_html(StringIO(html), flavor="lxml", converters=_MAIN_CONVERTERS,
+                                  keep_default_na=False)
+        except ValueError:  # No tables found
+            return self._parse_main_table_rows(html)
+
+        df = next((table for table in tables if not table.empty), None)
+        if df is None or len(df.columns) != len(_MAIN_COLUMNS):
+            return self._parse_main_table_rows(html)
+
+        df.columns = _MAIN_COLUMNS
+        return df
+
+    def _parse_main_table_rows(self, html: str) -> pd.DataFrame:
+        """
+        Parse the main table row by row with BeautifulSoup.
+        
+        Fallback for parse_main_table when pandas cannot read the table.
+        
+        Args:
+            html (str): HTML content of the search results page.
+            
+        Returns:
+            pandas.DataFrame: DataFrame containing data from the search results table.
+        """
+        soup = BeautifulSoup(html, builder=LXML_BUILDER, parse_only=_TABLE_STRAINER)
         table = soup.find("table")
 
         if not table:
@@ -120,12 +290,13 @@ class KnapsackScraper:
             return pd.DataFrame()
 
         data = []
-        data.append(["C_ID", "CAS_ID", "Metabolite", "Molecular_Formula", "Mw", "Organism or InChIKey etc."])
+        data.append(_MAIN_COLUMNS)
         rows = table.find_all("tr")
 
         for row in rows:
             cols = row.find_all("td")
-            data.append([col.get_text(strip=True) for col in cols])
+            if cols:  # Skip the header row, which only has <th> cells
+                data.append([col.get_text(strip=True) for col in cols])
 
         return pd.DataFrame(data[1:], columns=data[0])
 
@@ -135,21 +306,21 @@ class KnapsackScraper:
         Parse the organism table from the KNApSAcK detail page.
         
         Args:
-            organism_table (BeautifulSoup): Organism table element.
+            organism_table (lxml.etree._Element): Organism table element.
             
         Returns:
             list: List of organisms containing this compound.
         """
         organisms = []
-        rows = organism_table.find_all("tr")[1:]
+        rows = list(organism_table.iter("tr"))[1:]
         for row in rows:
-            cols = row.find_all("td")
+            cols = list(row.iter("td"))
             if len(cols) >= 4:
                 organisms.append({
-                    "kingdom": cols[0].get_text(strip=True),
-                    "family": cols[1].get_text(strip=True),
-                    "species": cols[2].get_text(strip=True),
-                    "reference": cols[3].get_text(strip=True)
+                    "kingdom": _text(cols[0]),
+                    "family": _text(cols[1]),
+                    "species": _text(cols[2]),
+                    "reference": _text(cols[3])
                 })
         return organisms
 
@@ -157,6 +328,9 @@ class KnapsackScraper:
         """
         Get compound details based on KNApSAcK C_ID.
         
+        The page is streamed and parsed chunk by chunk; parsing stops as soon as
+        every field has been found, without holding the whole page in memory.
+        
         Args:
             cid (str): KNApSAcK compound ID (C_ID).
             
@@ -165,54 +339,95 @@ class KnapsackScraper:
         """
         try:
             url = f"{self.DETAIL_URL}{quote(cid)}"
-            html = self.fetch_html(url)
-            soup = BeautifulSoup(html, "html.parser")
-
-            detail = {
-                "C_ID": cid,
-                "InChIKey": None,
-                "InChICode": None,
-                "SMILES": None,
-                "image_url": None,
-                "Organism": None
-            }
-
-            table = soup.find("table", class_="d3")
-            if table:
-                for row in table.find_all("tr"):
-                    header = row.find("th", class_="inf")
-                    if not header:
-                        continue
-
-                    label = header.get_text(strip=True)
-                    td = row.find("td")
-                    value = td.get_text(strip=True) if td else None
-
-                    if label == "InChIKey":
-                        detail["InChIKey"] = value
-                    elif label == "InChICode":
-                        detail["InChICode"] = value
-                    elif label == "SMILES":
-                        detail["SMILES"] = value
-                    elif label == "Organism":
-                        organism_table = row.find_next("table")
-                        if organism_table:
-                            detail["Organism"] = self.parse_organism_table(organism_table)
-
-            # Image
-            image_tag = soup.find("img", attrs={"property": "image"})
-            if image_tag and image_tag.get("src"):
-                detail["image_url"] = f"https://www.knapsackfamily.com{image_tag['src']}"
-
+            log.debug(f"🔗 Fetching URL: {url}")
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                parser = _DetailPageParser(self, cid, response.encoding)
+                chunks = response.iter_content(_CHUNK_SIZE)
+                for chunk in chunks:
+                    if parser.feed(chunk):
+                        break
+                # Drain the body so the connection can be reused (and the page cached)
+                for _ in chunks:
+                    pass
             log.debug(f"✅ Detail OK: {cid}")
-            return detail
+            return parser.close()
+        except Exception as e:
+            log.error(f"❌ Failed to retrieve details for {cid}: {e}")
+            return self._empty_detail(cid)
 
+    async def get_detail_by_cid_async(self, client, cid: str) -> dict:
+        """
+        Async counterpart of get_detail_by_cid using an httpx client.
+        
+        Args:
+            client (httpx.AsyncClient): Active async HTTP client.
+            cid (str): KNApSAcK compound ID (C_ID).
+            
+        Returns:
+            dict: Compound detail data as a dictionary.
+        """
+        try:
+            url = f"{self.DETAIL_URL}{quote(cid)}"
+            log.debug(f"🔗 Fetching URL: {url}")
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                parser = _DetailPageParser(self, cid, response.charset_encoding)
+                chunks = response.aiter_bytes(_CHUNK_SIZE)
+                async for chunk in chunks:
+                    if parser.feed(chunk):
+                        break
+                async for _ in chunks:
+                    pass
+            log.debug(f"✅ Detail OK: {cid}")
+            return parser.close()
         except Exception as e:
             log.error(f"❌ Failed to retrieve details for {cid}: {e}")
-            return {
-                "C_ID": cid, "InChIKey": None, "InChICode": None,
-                "SMILES": None, "image_url": None, "Organism": None
-            }
+            return self._empty_detail(cid)
+
+    def _empty_detail(self, cid: str) -> dict:
+        """
+        Build the detail record returned when a detail page cannot be retrieved.
+        
+        Args:
+            cid (str): KNApSAcK compound ID (C_ID).
+            
+        Returns:
+            dict: Detail dictionary with every field except C_ID set to None.
+        """
+        return {
+            "C_ID": cid, "InChIKey": None, "InChICode": None,
+            "SMILES": None, "image_url": None, "Organism": None
+        }
+
+    def parse_detail(self, html: str, cid: str) -> dict:
+        """
+        Parse a KNApSAcK detail page.
+        
+        Args:
+            html (str): HTML content of the detail page.
+            cid (str): KNApSAcK compound ID (C_ID).
+            
+        Returns:
+            dict: Compound detail data as a dictionary.
+        """
+        parser = _DetailPageParser(self, cid)
+        parser.feed(html)
+        return parser.close()
+
+    async def _fetch_details_async(self, cids, on_result):
+        """
+        Retrieve all detail pages concurrently over one HTTP/2 client.
+        
+        Args:
+            cids (iterable): KNApSAcK compound IDs to retrieve.
+            on_result (callable): Called with each detail dictionary as it completes.
+        """
+        async with build_async_client(self.max_workers) as client:
+            await gather_bounded(
+                lambda cid: self.get_detail_by_cid_async(client, cid),
+                cids, self.max_workers, on_result
+            )
 
     def search(self) -> pd.DataFrame:
         """
@@ -238,7 +453,9 @@ class KnapsackScraper:
 
         log.info(f"📄 {len(df_main)} entries found. Retrieving details...")
 
-        detail_list = []
+        # Each C_ID is fetched once, even if it is listed more than once
+        cids = list(dict.fromkeys(df_main["C_ID"]))
+        details_by_cid = {}
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -247,17 +464,20 @@ class KnapsackScraper:
             TimeElapsedColumn(),
             transient=True
         ) as progress:
-            task = progress.add_task("[cyan]Retrieving C_ID details...", total=len(df_main))
+            task = progress.add_task("[cyan]Retrieving C_ID details...", total=len(cids))
+
+            def collect(detail):
+                details_by_cid[detail["C_ID"]] = detail
+                progress.advance(task)
 
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {executor.submit(self.get_detail_by_cid, cid): cid for cid in df_main["C_ID"]}
-                for future in as_completed(futures):
-                    detail = future.result()
-                    detail_list.append(detail)
-                    progress.advance(task)
+            if self.async_mode:
+                run_async(self._fetch_details_async(cids, collect))
+            else:
+                submit_bounded(self._executor, self.get_detail_by_cid, cids, 2 * self.max_workers, collect)
 
-        df_detail = pd.DataFrame(detail_list)
-        df_merged = pd.merge(df_main, df_detail, on="C_ID", how="left")
+        # Fill the detail columns by C_ID lookup instead of a merge
+        for column in _DETAIL_FIELDS:
+            df_main[column] = [details_by_cid[cid][column] for cid in df_main["C_ID"]]
 
         log.info("✅ All data retrieval completed.")
-        return df_merged 
\ No newline at end of file
+        return df_main 
\ No newline at end of file
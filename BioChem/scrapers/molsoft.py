@@ -26,19 +26,28 @@ print(results)
 ```
 """
 
-from rdkit import Chem
-from rdkit.Chem import AllChem
-import requests
 import re
+import asyncio
+from html import unescape
 import pandas as pd
-from bs4 import BeautifulSoup
-from typing import Union, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from lxml import etree
+from typing import Union, List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 from rich.console import Console
 from rich.logging import RichHandler
 import logging
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional, pages are then parsed with lxml
+    LexborHTMLParser = None
+
+from BioChem.scrapers._common import (
+    build_session, build_async_client, decode_text, gather_bounded, run_async, submit_bounded,
+    precompute_molblocks, smiles_to_molblock
+)
+
 # Configure rich logging
 console = Console()
 logging.basicConfig(
@@ -49,6 +58,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger("molsoft_scraper")
 
+# A bold label and the text that directly follows it, e.g. "<b>MolLogP :</b> 1.24"
+_LABEL_RE = re.compile(r"<b(?:\s[^>]*)?>([^<]*)</b\s*>([^<]*)", re.IGNORECASE)
+_LOGS_RE = re.compile(r"([-\d.]+)\s+\(in Log")
+_BBB_RE = re.compile(r"^\s*([-\d.]+)")
+
+# Columns of the DataFrame returned by run(), in the order parse_html() fills them
+_RESULT_COLUMNS = [
+    "SMILES",
+    "Molecular formula",
+    "Molecular weight",
+    "HBA",
+    "HBD",
+    "MolLogP",
+    "MolLogS",
+    "MolPSA",
+    "MolVol",
+    "pKa",
+    "BBB Score",
+    "Number of stereo centers"
+]
+
 
 class MolsoftScraper:
     """
@@ -57,27 +87,60 @@ class MolsoftScraper:
     This class provides functionality to submit SMILES to Molsoft
     and get molecular property prediction results in DataFrame format.
     Properties retrieved include LogP, LogS, PSA, and other parameters
-    relevant for drug development.
+    relevant for drug development. With async_mode enabled, SMILES are
+    submitted concurrently from one asyncio event loop over an HTTP/2 httpx
+    client instead of a thread pool.
+    
+    The HTTP session and worker thread pool live as long as the scraper and are
+    reused by every run() call; call close() (or use the scraper as a context
+    manager) to release them.
     
     Attributes:
         BASE_URL (str): Base URL of Molsoft for molecular properties.
-        max_workers (int): Maximum number of thread workers for parallel processing.
+        max_workers (int): Maximum number of thread workers (or concurrent requests in async mode).
+        async_mode (bool): Whether SMILES are processed with httpx and asyncio.
+        n_jobs (int): Number of processes used to precompute MolBlocks (1: no pool, None: all cores).
+        session (requests.Session): Pooled HTTP session shared by all requests.
     """
     
     BASE_URL = "https://www.molsoft.com/mprop/"
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, async_mode: bool = False, n_jobs: Optional[int] = 1):
         """
         Initialize MolsoftScraper.
         
         Args:
             max_workers (int, optional): Maximum number of thread workers. Default 4.
+            async_mode (bool, optional): Process SMILES with httpx and asyncio instead of
+                threads. Requires the 'async' extra (httpx[http2]). Default False.
+            n_jobs (int, optional): Number of processes used to precompute MolBlocks for
+                large batches, None for all cores. Values above 1 require an
+                `if __name__ == "__main__":` guard in the calling script on Windows
+                and macOS. Default 1 (no process pool).
         """
         self.max_workers = max_workers
+        self.async_mode = async_mode
+        self.n_jobs = n_jobs
+        self._molblocks = {}
+        self.session = build_session(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="molsoft")
+
+    def close(self):
+        """
+        Close the HTTP session and shut down the worker thread pool.
+        """
+        self.session.close()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def smiles_to_molblock(self, smiles: str) -> str:
         """
-        Convert SMILES to MolBlock format with 2D coordinates.
+        Convert SMILES to MolBlock format with 2D coordinates (precomputed or cached per SMILES).
         
         Args:
             smiles (str): Valid SMILES string.
@@ -88,11 +151,7 @@ class MolsoftScraper:
         Raises:
             ValueError: If SMILES is invalid.
         """
-        mol = Chem.MolFromSmiles(smiles)
-        if mol is None:
-            raise ValueError(f"Invalid SMILES: {smiles}")
-        AllChem.Compute2DCoords(mol)
-        mol_block = Chem.MolToMolBlock(mol)
+        mol_block = self._molblocks.get(smiles) or smiles_to_molblock(smiles, compute_2d=True)
         return mol_block.replace("RDKit", "MOLSOFT", 1)
 
     def fetch_html(self, smiles: str) -> str:
@@ -108,7 +167,46 @@ class MolsoftScraper:
         Raises:
             ConnectionError: If connection to server fails.
         """
-        mol_block = self.smiles_to_molblock(smiles)
+        payload, headers = self._build_submission(self.smiles_to_molblock(smiles))
+        response = self.session.post(self.BASE_URL, data=payload, headers=headers, timeout=30)
+        if response.status_code != 200:
+            raise ConnectionError(f"Failed to retrieve data for {smiles}, status: {response.status_code}")
+        return decode_text(response)
+
+    async def fetch_html_async(self, client, smiles: str) -> str:
+        """
+        Async counterpart of fetch_html using an httpx client.
+        
+        The MolBlock conversion runs in the default executor so RDKit does not
+        block the event loop.
+        
+        Args:
+            client (httpx.AsyncClient): Active async HTTP client.
+            smiles (str): Valid SMILES string.
+            
+        Returns:
+            str: HTML content of the response.
+            
+        Raises:
+            ConnectionError: If connection to server fails.
+        """
+        mol_block = await asyncio.get_running_loop().run_in_executor(None, self.smiles_to_molblock, smiles)
+        payload, headers = self._build_submission(mol_block)
+        response = await client.post(self.BASE_URL, data=payload, headers=headers)
+        if response.status_code != 200:
+            raise ConnectionError(f"Failed to retrieve data for {smiles}, status: {response.status_code}")
+        return decode_text(response)
+
+    def _build_submission(self, mol_block: str):
+        """
+        Build the form payload and headers for a Molsoft request.
+        
+        Args:
+            mol_block (str): MolBlock of the molecule.
+            
+        Returns:
+            tuple: (payload, headers) dictionaries.
+        """
         payload = {
             "p": "",
             "sm": "",
@@ -120,13 +218,40 @@ class MolsoftScraper:
         headers = {
             "Content-Type": "application/x-www-form-urlencoded"
         }
+        return payload, headers
 
-        response = requests.post(self.BASE_URL, data=payload, headers=headers)
-        if response.status_code != 200:
-            raise ConnectionError(f"Failed to retrieve data for {smiles}, status: {response.status_code}")
-        return response.text
-
-    def parse_html(self, html: str, smiles: str) -> pd.DataFrame:
+    def extract_labels(self, html: str) -> List[Tuple[str, Optional[str]]]:
+        """
+        Extract every bold label together with the text that directly follows it.
+        
+        Molsoft's result page is a fixed template, so the pairs are read with one
+        regex pass over the raw HTML; the page is only parsed into a tree when the
+        regex finds nothing (e.g. after a template change).
+        
+        Args:
+            html (str): HTML content of the response.
+            
+        Returns:
+            list: List of (label, following text) tuples; the text is None when the
+                label is not followed by a text node.
+        """
+        labels = [(unescape(label), unescape(text) if text else None) for label, text in _LABEL_RE.findall(html)]
+        if labels:
+            return labels
+
+        if LexborHTMLParser:
+            return [
+                (b.text(), b.next.text() if b.next is not None and b.next.tag == "-text" else None)
+                for b in LexborHTMLParser(html).css("b")
+            ]
+
+        # Only <b> elements are visited; the text after each one is its lxml tail
+        root = etree.HTML(html)
+        if root is None:
+            return []
+        return [("".join(b.itertext()), b.tail or None) for b in root.iter("b")]
+
+    def parse_html(self, html: str, smiles: str) -> Dict[str, Optional[str]]:
         """
         Parse HTML from Molsoft results and extract molecular property information.
         
@@ -135,49 +260,46 @@ class MolsoftScraper:
             smiles (str): SMILES used in the request.
             
         Returns:
-            pandas.DataFrame: DataFrame containing molecular properties.
+            dict: Molecular properties keyed by column name.
         """
-        soup = BeautifulSoup(html, "html.parser")
-        b_tags = soup.find_all("b")
+        labels = self.extract_labels(html)
 
         def get_value(key):
-            tag = next((b for b in b_tags if key in b.text), None)
-            if tag:
-                return tag.next_sibling.strip() if tag.next_sibling else None
-            return None
+            text = next((text for label, text in labels if key in label), None)
+            return text.strip() if text else None
 
         logs_text = get_value("MolLogS :")
         logs_val = None
         if logs_text:
-            match = re.search(r"([-\d.]+)\s+\(in Log", logs_text)
+            match = _LOGS_RE.search(logs_text)
             logs_val = match.group(1) if match else None
 
         bbb_score_text = get_value("BBB Score :")
         bbb_score = None
         if bbb_score_text:
-            match = re.search(r"^\s*([-\d.]+)", bbb_score_text)
+            match = _BBB_RE.search(bbb_score_text)
             bbb_score = match.group(1) if match else None
 
         data = {
-            "SMILES": [smiles],
-            "Molecular formula": [get_value("Molecular formula:")],
-            "Molecular weight": [get_value("Molecular weight:")],
-            "HBA": [get_value("Number of HBA:")],
-            "HBD": [get_value("Number of HBD:")],
-            "MolLogP": [get_value("MolLogP :")],
-            "MolLogS": [logs_val],
-            "MolPSA": [get_value("MolPSA :")],
-            "MolVol": [get_value("MolVol :")],
-            "pKa": [get_value("pKa of most Basic/Acidic group :")],
-            "BBB Score": [bbb_score],
-            "Number of stereo centers": [get_value("Number of stereo centers:")]
+            "SMILES": smiles,
+            "Molecular formula": get_value("Molecular formula:"),
+            "Molecular weight": get_value("Molecular weight:"),
+            "HBA": get_value("Number of HBA:"),
+            "HBD": get_value("Number of HBD:"),
+            "MolLogP": get_value("MolLogP :"),
+            "MolLogS": logs_val,
+            "MolPSA": get_value("MolPSA :"),
+            "MolVol": get_value("MolVol :"),
+            "pKa": get_value("pKa of most Basic/Acidic group :"),
+            "BBB Score": bbb_score,
+            "Number of stereo centers": get_value("Number of stereo centers:")
         }
 
-        return pd.DataFrame(data)
+        return data
 
 
 
-    def process_single(self, smiles: str) -> pd.DataFrame:
+    def process_single(self, smiles: str) -> Optional[Dict[str, Optional[str]]]:
         """
         Process a single SMILES and retrieve its molecular property data.
         
@@ -185,17 +307,50 @@ class MolsoftScraper:
             smiles (str): Valid SMILES string.
             
         Returns:
-            pandas.DataFrame: DataFrame containing molecular properties.
+            dict: Molecular properties, or None if the request failed.
         """
         try:
             html = self.fetch_html(smiles)
-            df = self.parse_html(html, smiles)
+            record = self.parse_html(html, smiles)
+            console.log(f"[green]✔ Success:[/] {smiles}")
+            return record
+        except Exception as e:
+            console.log(f"[red]✖ Failed:[/] {smiles} | {e}")
+            return None
+
+    async def process_single_async(self, client, smiles: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Async counterpart of process_single.
+        
+        Args:
+            client (httpx.AsyncClient): Active async HTTP client.
+            smiles (str): Valid SMILES string.
+            
+        Returns:
+            dict: Molecular properties, or None if the request failed.
+        """
+        try:
+            html = await self.fetch_html_async(client, smiles)
+            record = self.parse_html(html, smiles)
             console.log(f"[green]✔ Success:[/] {smiles}")
-            return df
+            return record
         except Exception as e:
             console.log(f"[red]✖ Failed:[/] {smiles} | {e}")
-            return pd.DataFrame()
+            return None
 
+    async def _run_async(self, smiles_list, on_result):
+        """
+        Process all SMILES concurrently over one HTTP/2 client.
+        
+        Args:
+            smiles_list (list): List of SMILES to process.
+            on_result (callable): Called with each result record (or None) as it completes.
+        """
+        async with build_async_client(self.max_workers) as client:
+            await gather_bounded(
+                lambda smiles: self.process_single_async(client, smiles),
+                smiles_list, self.max_workers, on_result
+            )
 
     def run(self, smiles_input: Union[str, List[str]]) -> pd.DataFrame:
         """
@@ -210,9 +365,11 @@ class MolsoftScraper:
         smiles_list = [smiles_input] if isinstance(smiles_input, str) else smiles_input
         logger.info(f"[cyan]🔍 Starting scraping {len(smiles_list)} SMILES...[/]")
 
+        # Convert every SMILES up front so the workers spend their time on network IO
+        self._molblocks = precompute_molblocks(smiles_list, compute_2d=True, n_jobs=self.n_jobs)
+
         results = []
         total = len(smiles_list)
-        completed = 0
 
         with Progress(
             SpinnerColumn(),
@@ -226,22 +383,22 @@ class MolsoftScraper:
 
             task_id = progress.add_task(f"[yellow]⏳ Processing SMILES... [0/{total}]", total=total)
 
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(self.process_single, smiles): smiles
-                    for smiles in smiles_list
-                }
+            def collect(result):
+                if result is not None:
+                    results.append(result)
 
-                for future in as_completed(futures):
-                    result = future.result()
-                    completed += 1
+                # Update progress bar & description
+                progress.update(task_id, advance=1,
+                                description=f"[yellow]⏳ Processing SMILES... [{progress.tasks[0].completed + 1}/{total}]")
 
-                    if not result.empty:
-                        results.append(result)
+            if self.async_mode:
+                run_async(self._run_async(smiles_list, collect))
+            else:
+                submit_bounded(self._executor, self.process_single, smiles_list, 2 * self.max_workers, collect)
 
-                    # Update progress bar & description
-                    progress.update(task_id, advance=1, description=f"[yellow]⏳ Processing SMILES... [{completed}/{total}]")
+        self._molblocks = {}
 
-        final_df = pd.concat(results, ignore_index=True)
+        # One DataFrame for all records instead of concatenating one-row frames
+        final_df = pd.DataFrame.from_records(results, columns=_RESULT_COLUMNS)
         logger.info(f"[bold green]🏁 Finished![/] Total successful: {len(final_df)} / {len(smiles_list)}")
         return final_df
\ No newline at end of file
@@ -26,20 +26,28 @@ print(results)
 ```
 """
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
-from typing import Union, List, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from rdkit import Chem
-from rdkit.Chem import rdmolfiles
+from typing import Union, List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 from rich.logging import RichHandler
 import logging
+import asyncio
 import time
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional, pages are then parsed with BeautifulSoup
+    LexborHTMLParser = None
+
+from BioChem.scrapers._common import (
+    LXML_BUILDER, build_session, build_async_client, decode_text, gather_bounded, run_async, submit_bounded,
+    precompute_molblocks, smiles_to_molblock
+)
+
 # Configure rich logging
 console = Console()
 logging.basicConfig(
@@ -50,6 +58,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger("protox_scraper")
 
+# Only the <h1> headings carry results
+_H1_STRAINER = SoupStrainer("h1")
+
+# Columns of the DataFrame returned by run(), in the order parse_html() fills them
+_RESULT_COLUMNS = [
+    "SMILES",
+    "Predicted LD50",
+    "Toxicity Class",
+    "Average Similarity",
+    "Prediction Accuracy"
+]
+
 
 class ProtoxScraper:
     """
@@ -57,17 +77,27 @@ class ProtoxScraper:
     
     This class provides functionality to submit chemical compounds in SMILES format
     to the ProTox-II server and get toxicity prediction results in DataFrame format.
+    With async_mode enabled, SMILES are submitted concurrently from one asyncio
+    event loop over an HTTP/2 httpx client instead of a thread pool.
+    
+    The HTTP session and worker thread pool live as long as the scraper and are
+    reused by every run() call; call close() (or use the scraper as a context
+    manager) to release them.
     
     Attributes:
         BASE_URL (str): Base URL of ProTox-II for similarity-based search.
-        max_workers (int): Maximum number of thread workers for parallel processing.
+        max_workers (int): Maximum number of thread workers (or concurrent requests in async mode).
         auto_resume (bool): Whether to automatically resume after a rate limit.
         wait_minutes (int): How many minutes to wait after a rate limit.
+        async_mode (bool): Whether SMILES are processed with httpx and asyncio.
+        n_jobs (int): Number of processes used to precompute MolBlocks (1: no pool, None: all cores).
+        session (requests.Session): Pooled HTTP session shared by all requests.
     """
     
     BASE_URL = "https://tox.charite.de/protox3/index.php?site=compound_search_similarity"
 
-    def __init__(self, max_workers: int = 4, auto_resume: bool = False, wait_minutes: int = 10):
+    def __init__(self, max_workers: int = 4, auto_resume: bool = False, wait_minutes: int = 10,
+                 async_mode: bool = False, n_jobs: Optional[int] = 1):
         """
         Initialize ProtoxScraper.
         
@@ -75,15 +105,39 @@ class ProtoxScraper:
             max_workers (int, optional): Maximum number of thread workers. Default 4.
             auto_resume (bool, optional): Whether to automatically resume after a rate limit. Default False.
             wait_minutes (int, optional): How many minutes to wait after a rate limit. Default 10.
+            async_mode (bool, optional): Process SMILES with httpx and asyncio instead of
+                threads. Requires the 'async' extra (httpx[http2]). Default False.
+            n_jobs (int, optional): Number of processes used to precompute MolBlocks for
+                large batches, None for all cores. Values above 1 require an
+                `if __name__ == "__main__":` guard in the calling script on Windows
+                and macOS. Default 1 (no process pool).
         """
         self.max_workers = max_workers
         self.auto_resume = auto_resume
         self.wait_minutes = wait_minutes
+        self.async_mode = async_mode
+        self.n_jobs = n_jobs
+        self._molblocks = {}
+        self.session = build_session(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="protox")
+
+    def close(self):
+        """
+        Close the HTTP session and shut down the worker thread pool.
+        """
+        self.session.close()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
     def smiles_to_molblock(self, smiles: str) -> str:
         """
-        Convert SMILES to MolBlock format.
+        Convert SMILES to MolBlock format (precomputed or cached per SMILES).
         
         Args:
             smiles (str): Valid SMILES string.
@@ -94,10 +148,7 @@ class ProtoxScraper:
         Raises:
             ValueError: If SMILES is invalid.
         """
-        mol = Chem.MolFromSmiles(smiles)
-        if mol is None:
-            raise ValueError(f"Invalid SMILES: {smiles}")
-        return rdmolfiles.MolToMolBlock(mol)
+        return self._molblocks.get(smiles) or smiles_to_molblock(smiles)
 
     def fetch_html(self, smiles: str) -> str:
         """
@@ -113,32 +164,91 @@ class ProtoxScraper:
             ConnectionError: If connection to server fails.
             RuntimeError: If rate limited and auto_resume is False.
         """
-        molblock = self.smiles_to_molblock(smiles)
-        payload = {
+        payload = self._build_payload(smiles, self.smiles_to_molblock(smiles))
+        response = self.session.post(self.BASE_URL, data=payload, timeout=30)
+        if response.status_code != 200:
+            raise ConnectionError(f"Failed to retrieve data for {smiles}, status: {response.status_code}")
+
+        html = decode_text(response)
+        if self._is_rate_limited(html, smiles):
+            time.sleep(self.wait_minutes * 60)
+            return self.fetch_html(smiles)  # Retry after sleeping
+
+        return html
+
+    async def fetch_html_async(self, client, smiles: str) -> str:
+        """
+        Async counterpart of fetch_html using an httpx client.
+        
+        The MolBlock conversion runs in the default executor so RDKit does not
+        block the event loop.
+        
+        Args:
+            client (httpx.AsyncClient): Active async HTTP client.
+            smiles (str): Valid SMILES string.
+            
+        Returns:
+            str: HTML content of the request result.
+            
+        Raises:
+            ConnectionError: If connection to server fails.
+            RuntimeError: If rate limited and auto_resume is False.
+        """
+        molblock = await asyncio.get_running_loop().run_in_executor(None, self.smiles_to_molblock, smiles)
+        response = await client.post(self.BASE_URL, data=self._build_payload(smiles, molblock))
+        if response.status_code != 200:
+            raise ConnectionError(f"Failed to retrieve data for {smiles}, status: {response.status_code}")
+
+        html = decode_text(response)
+        if self._is_rate_limited(html, smiles):
+            await asyncio.sleep(self.wait_minutes * 60)
+            return await self.fetch_html_async(client, smiles)  # Retry after sleeping
+
+        return html
+
+    def _build_payload(self, smiles: str, molblock: str) -> Dict[str, str]:
+        """
+        Build the form payload for a ProTox-II request.
+        
+        Args:
+            smiles (str): Valid SMILES string.
+            molblock (str): MolBlock of the molecule.
+            
+        Returns:
+            dict: Form payload.
+        """
+        return {
             "smilesString": molblock,
             "defaultName": "Tamoxifen",
             "smiles": smiles,
             "pubchem_name": ""
         }
 
-        response = requests.post(self.BASE_URL, data=payload, timeout=30)
-        if response.status_code != 200:
-            raise ConnectionError(f"Failed to retrieve data for {smiles}, status: {response.status_code}")
-
-        # Check if blocked due to rate limit
-        if "You reached the limit of allowed queries" in response.text:
-            logger.warning(f"[bold yellow]⚠ Hit rate limit while requesting: {smiles}[/]")
+    def _is_rate_limited(self, html: str, smiles: str) -> bool:
+        """
+        Check whether the response reports that the query limit was reached.
+        
+        Args:
+            html (str): HTML content of the request result.
+            smiles (str): SMILES used in the request.
+            
+        Returns:
+            bool: True if rate limited and the caller should wait and retry.
+            
+        Raises:
+            RuntimeError: If rate limited and auto_resume is False.
+        """
+        if "You reached the limit of allowed queries" not in html:
+            return False
 
-            if self.auto_resume:
-                logger.info(f"[blue]⏳ Waiting {self.wait_minutes} minutes before continuing...[/]")
-                time.sleep(self.wait_minutes * 60)
-                return self.fetch_html(smiles)  # Retry after sleeping
-            else:
-                raise RuntimeError("Rate limit detected. Try again later.")
+        logger.warning(f"[bold yellow]⚠ Hit rate limit while requesting: {smiles}[/]")
+        if not self.auto_resume:
+            raise RuntimeError("Rate limit detected. Try again later.")
 
-        return response.text
+        logger.info(f"[blue]⏳ Waiting {self.wait_minutes} minutes before continuing...[/]")
+        return True
 
-    def parse_html(self, html: str, smiles: str) -> pd.DataFrame:
+    def parse_html(self, html: str, smiles: str) -> Dict[str, Optional[str]]:
         """
         Parse HTML from ProTox-II results.
         
@@ -147,25 +257,29 @@ class ProtoxScraper:
             smiles (str): SMILES used in the request.
             
         Returns:
-            pandas.DataFrame: DataFrame containing toxicity prediction results.
+            dict: Toxicity prediction results keyed by column name.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        if LexborHTMLParser:
+            headings = [h1.text(strip=True) for h1 in LexborHTMLParser(html).css("h1")]
+        else:
+            soup = BeautifulSoup(html, builder=LXML_BUILDER, parse_only=_H1_STRAINER)
+            headings = [h1.get_text(strip=True) for h1 in soup.find_all("h1")]
 
         def extract_text(label: str) -> str:
-            h1 = soup.find("h1", string=lambda s: s and label in s)
-            return h1.get_text(strip=True).split(":")[-1].strip() if h1 else None
+            text = next((text for text in headings if label in text), None)
+            return text.split(":")[-1].strip() if text else None
 
         data = {
-            "SMILES": [smiles],
-            "Predicted LD50": [extract_text("Predicted LD50")],
-            "Toxicity Class": [extract_text("Predicted Toxicity Class")],
-            "Average Similarity": [extract_text("Average similarity")],
-            "Prediction Accuracy": [extract_text("Prediction accuracy")]
+            "SMILES": smiles,
+            "Predicted LD50": extract_text("Predicted LD50"),
+            "Toxicity Class": extract_text("Predicted Toxicity Class"),
+            "Average Similarity": extract_text("Average similarity"),
+            "Prediction Accuracy": extract_text("Prediction accuracy")
         }
 
-        return pd.DataFrame(data)
+        return data
 
-    def process_single(self, smiles: str) -> pd.DataFrame:
+    def process_single(self, smiles: str) -> Optional[Dict[str, Optional[str]]]:
         """
         Process a single SMILES and retrieve its toxicity data.
         
@@ -173,16 +287,50 @@ class ProtoxScraper:
             smiles (str): Valid SMILES string.
             
         Returns:
-            pandas.DataFrame: DataFrame containing toxicity prediction results.
+            dict: Toxicity prediction results, or None if the request failed.
         """
         try:
             html = self.fetch_html(smiles)
-            df = self.parse_html(html, smiles)
+            record = self.parse_html(html, smiles)
             console.log(f"[green]✔ Success:[/] {smiles}")
-            return df
+            return record
         except Exception as e:
             console.log(f"[red]✖ Failed:[/] {smiles} | {e}")
-            return pd.DataFrame()
+            return None
+
+    async def process_single_async(self, client, smiles: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Async counterpart of process_single.
+        
+        Args:
+            client (httpx.AsyncClient): Active async HTTP client.
+            smiles (str): Valid SMILES string.
+            
+        Returns:
+            dict: Toxicity prediction results, or None if the request failed.
+        """
+        try:
+            html = await self.fetch_html_async(client, smiles)
+            record = self.parse_html(html, smiles)
+            console.log(f"[green]✔ Success:[/] {smiles}")
+            return record
+        except Exception as e:
+            console.log(f"[red]✖ Failed:[/] {smiles} | {e}")
+            return None
+
+    async def _run_async(self, smiles_list, on_result):
+        """
+        Process all SMILES concurrently over one HTTP/2 client.
+        
+        Args:
+            smiles_list (list): List of SMILES to process.
+            on_result (callable): Called with each result record (or None) as it completes.
+        """
+        async with build_async_client(self.max_workers) as client:
+            await gather_bounded(
+                lambda smiles: self.process_single_async(client, smiles),
+                smiles_list, self.max_workers, on_result
+            )
 
     def run(self, smiles_input: Union[str, List[str]]) -> pd.DataFrame:
         """
@@ -197,9 +345,11 @@ class ProtoxScraper:
         smiles_list = [smiles_input] if isinstance(smiles_input, str) else smiles_input
         logger.info(f"[cyan]🔍 Starting scraping {len(smiles_list)} SMILES...[/]")
 
+        # Convert every SMILES up front so the workers spend their time on network IO
+        self._molblocks = precompute_molblocks(smiles_list, n_jobs=self.n_jobs)
+
         results = []
         total = len(smiles_list)
-        completed = 0
 
         with Progress(
             SpinnerColumn(),
@@ -213,22 +363,22 @@ class ProtoxScraper:
 
             task_id = progress.add_task(f"[yellow]⏳ Processing SMILES... [0/{total}]", total=total)
 
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(self.process_single, smiles): smiles
-                    for smiles in smiles_list
-                }
+            def collect(result):
+                if result is not None:
+                    results.append(result)
 
-                for future in as_completed(futures):
-                    result = future.result()
-                    completed += 1
+                # Update progress bar
+                progress.update(task_id, advance=1,
+                                description=f"[yellow]⏳ Processing SMILES... [{progress.tasks[0].completed + 1}/{total}]")
 
-                    if not result.empty:
-                        results.append(result)
+            if self.async_mode:
+                run_async(self._run_async(smiles_list, collect))
+            else:
+                submit_bounded(self._executor, self.process_single, smiles_list, 2 * self.max_workers, collect)
 
-                    # Update progress bar
-                    progress.update(task_id, advance=1, description=f"[yellow]⏳ Processing SMILES... [{completed}/{total}]")
+        self._molblocks = {}
 
-        final_df = pd.concat(results, ignore_index=True)
+        # One DataFrame for all records instead of concatenating one-row frames
+        final_df = pd.DataFrame.from_records(results, columns=_RESULT_COLUMNS)
         logger.info(f"[bold green]🏁 Finished![/] Total successful: {len(final_df)} / {len(smiles_list)}")
         return final_df 
\ No newline at end of file
@@ -24,9 +24,17 @@ setup(
     install_requires=[
         "requests>=2.26.0",
         "beautifulsoup4>=4.10.0",
+        "lxml>=4.6.0",
         "pandas>=1.3.0",
+        "numpy>=1.20.0",
         "rich>=12.0.0",
         "rdkit>=2022.03.1",
         "Pillow>=9.0.0",
     ],
+    extras_require={
+        "arrow": ["pyarrow>=14.0.0"],
+        "async": ["httpx[http2]>=0.23.0", "uvloop>=0.18.0; sys_platform != 'win32'"],
+        "cache": ["requests-cache>=1.0.0"],
+        "fast": ["selectolax>=0.3.12"],
+    },
 ) 
\ No newline at end of file
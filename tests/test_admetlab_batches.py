@@ -0,0 +1,71 @@
+"""
+Tests for assembling ADMETlab batch results, with and without pyarrow.
+"""
+
+import pandas as pd
+import pytest
+
+from BioChem.scrapers import admetlab
+
+
+@pytest.fixture(params=["arrow", "pandas"])
+def arrow_mode(request, monkeypatch):
+    if request.param == "arrow":
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(admetlab, "pa", None)
+    return request.param
+
+
+def assemble(*frames):
+    return admetlab._assemble_batches([admetlab._to_arrow(frame) for frame in frames])
+
+
+def test_batches_with_different_columns_are_merged(arrow_mode):
+    first = pd.DataFrame({"smiles": ["C", "CC"], "MW": [16.04, 30.07]})
+    second = pd.DataFrame({"smiles": ["CCC"], "logP": [1.42]})
+
+    df = assemble(first, second)
+
+    assert list(df.columns) == ["smiles", "MW", "logP"]
+    assert list(df["smiles"]) == ["C", "CC", "CCC"]
+    assert df["MW"].tolist()[:2] == [16.04, 30.07]
+    assert pd.isna(df.loc[2, "MW"])
+    assert pd.isna(df.loc[0, "logP"]) and df.loc[2, "logP"] == 1.42
+
+
+def test_batches_with_conflicting_column_types_fall_back_to_pandas(arrow_mode):
+    first = pd.DataFrame({"smiles": ["C"], "note": [float("nan")]})
+    second = pd.DataFrame({"smiles": ["CC"], "note": ["invalid"]})
+
+    df = assemble(first, second)
+
+    assert list(df["smiles"]) == ["C", "CC"]
+    assert pd.isna(df.loc[0, "note"]) and df.loc[1, "note"] == "invalid"
+
+
+def test_batch_with_mixed_column_stays_a_dataframe(arrow_mode):
+    mixed = pd.DataFrame({"smiles": ["C", "CC"], "value": [1, "x"]})
+
+    assert isinstance(admetlab._to_arrow(mixed), pd.DataFrame)
+    df = assemble(mixed, pd.DataFrame({"smiles": ["CCC"], "value": [2]}))
+    assert df["value"].tolist() == [1, "x", 2]
+
+
+def test_no_batches_give_an_empty_dataframe(arrow_mode):
+    assert admetlab._assemble_batches([]).empty
+
+
+def test_old_pyarrow_without_promote_options_falls_back_to_pandas(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+
+    def concat_tables(tables, **kwargs):
+        if kwargs:
+            raise TypeError("concat_tables() got an unexpected keyword argument 'promote_options'")
+        return pa.concat_tables(tables)
+
+    monkeypatch.setattr(admetlab.pa, "concat_tables", concat_tables)
+    df = assemble(pd.DataFrame({"smiles": ["C"]}), pd.DataFrame({"smiles": ["CC"], "MW": [30.07]}))
+
+    assert list(df["smiles"]) == ["C", "CC"]
+    assert pd.isna(df.loc[0, "MW"])
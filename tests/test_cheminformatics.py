@@ -0,0 +1,75 @@
+"""
+Tests for the batch operations in BioChem.cheminformatics.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from rdkit import Chem
+
+from BioChem.cheminformatics import ChemAnalyzer, dedupe_smiles
+
+
+def test_batch_predict_properties_valid_and_invalid():
+    df = ChemAnalyzer.batch_predict_properties(["CCO", "not a smiles"])
+
+    assert list(df["smiles"]) == ["CCO", "not a smiles"]
+    assert list(df.columns[-3:]) == ["lipinski_violations", "lipinski_pass", "error"]
+
+    valid, invalid = df.iloc[0], df.iloc[1]
+    assert valid["MolecularWeight"] == pytest.approx(46.069)
+    assert valid["lipinski_violations"] == 0
+    assert valid["lipinski_pass"]
+    assert valid["error"] is None
+
+    assert np.isnan(invalid["MolecularWeight"])
+    assert invalid["lipinski_violations"] is pd.NA
+    assert not invalid["lipinski_pass"]
+    assert "not a smiles" in invalid["error"]
+
+
+def test_batch_predict_properties_dtypes():
+    df = ChemAnalyzer.batch_predict_properties(["CCO", "not a smiles"])
+
+    assert df["MolecularWeight"].dtype == np.float64
+    assert df["lipinski_violations"].dtype == "Int64"
+    assert df["lipinski_pass"].dtype == bool
+    assert df["error"].dtype == object
+
+
+def test_dedupe_smiles_keeps_first_seen_input():
+    unique, index_map = dedupe_smiles(["OCC", "CCO", "C(C)O", "c1ccccc1"])
+
+    assert unique == ["OCC", "c1ccccc1"]
+    assert index_map == [0, 0, 0, 1]
+
+
+def test_dedupe_smiles_keeps_invalid_smiles_distinct():
+    unique, index_map = dedupe_smiles(["bad1", "CCO", "bad2", "bad1"])
+
+    assert unique == ["bad1", "CCO", "bad2"]
+    assert index_map == [0, 1, 2, 0]
+
+
+def test_batch_predict_properties_expands_duplicates_in_input_order():
+    smiles = ["OCC", "c1ccccc1", "CCO", "bad"]
+    df = ChemAnalyzer.batch_predict_properties(smiles)
+
+    assert list(df["smiles"]) == smiles
+    assert df.loc[0, "MolecularWeight"] == df.loc[2, "MolecularWeight"]
+    assert df.loc[1, "MolecularWeight"] == pytest.approx(78.114)
+    assert df.loc[3, "error"] is not None
+
+
+def test_batch_minimize_expands_duplicates_and_shares_files(tmp_path):
+    smiles = ["OCC", "CC", "CCO"]
+    results = ChemAnalyzer.batch_minimize(smiles, method="uff", save_dir=str(tmp_path), n_jobs=1)
+
+    assert [result["smiles"] for result in results] == smiles
+    assert all(result["error"] is None for result in results)
+    assert results[0]["saved_file"] == results[2]["saved_file"] == str(tmp_path / "mol_1.sdf")
+    assert results[1]["saved_file"] == str(tmp_path / "mol_2.sdf")
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["mol_1.sdf", "mol_2.sdf"]
+    # The file is embedded from the input string, so atom order follows "OCC"
+    mol = Chem.MolFromMolFile(results[0]["saved_file"])
+    assert mol.GetAtomWithIdx(0).GetSymbol() == "O"
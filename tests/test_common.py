@@ -0,0 +1,31 @@
+"""
+Tests for the shared scraper helpers.
+"""
+
+import asyncio
+
+import pytest
+
+from BioChem.scrapers._common import gather_bounded
+
+
+def test_gather_bounded_limits_concurrency_and_keeps_other_results():
+    in_flight = 0
+    peak = 0
+    results = []
+
+    async def func(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if item == 5:
+            raise ValueError("boom")
+        return item
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(gather_bounded(func, range(50), 4, results.append))
+
+    assert peak == 4
+    assert sorted(results) == [i for i in range(50) if i != 5]
@@ -0,0 +1,94 @@
+"""
+Tests for the KNApSAcK results and detail page parsers, run against saved HTML fixtures.
+"""
+
+import pathlib
+
+import pandas as pd
+import pytest
+
+from BioChem.scrapers.knapsack import KnapsackScraper, _DetailPageParser
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+
+SALIX = {"kingdom": "Plantae", "family": "Salicaceae", "species": "Salix alba", "reference": "Ref A"}
+FILIPENDULA = {"kingdom": "Plantae", "family": "Rosaceae", "species": "Filipendula ulmaria", "reference": "Ref B"}
+
+
+@pytest.fixture
+def scraper():
+    with KnapsackScraper() as scraper:
+        yield scraper
+
+
+def read_fixture(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def test_parse_detail_nested_organism_table(scraper):
+    detail = scraper.parse_detail(read_fixture("knapsack_detail.html"), "C00000001")
+
+    assert detail == {
+        "C_ID": "C00000001",
+        "InChIKey": "BSYNRYMUTXBXSQ-UHFFFAOYSA-N",
+        "InChICode": "InChI=1S/C9H8O4/c1-6(10)13-8-5-3-2-4-7(8)9(11)12/h2-5H,1H3,(H,11,12)",
+        "SMILES": "CC(=O)Oc1ccccc1C(=O)O",
+        "image_url": "https://www.knapsackfamily.com/knapsack_core/img/C00000001.png",
+        "Organism": [SALIX, FILIPENDULA],
+    }
+
+
+def test_parse_detail_trailing_organism_table(scraper):
+    detail = scraper.parse_detail(read_fixture("knapsack_detail_trailing.html"), "C00000001")
+
+    assert detail["SMILES"] == "CC(=O)Oc1ccccc1C(=O)O"
+    assert detail["Organism"] == [SALIX]
+    assert detail["image_url"] is None
+
+
+def test_parse_detail_missing_page_content(scraper):
+    detail = scraper.parse_detail("<html><body><p>No data</p></body></html>", "C99999999")
+
+    assert detail == scraper._empty_detail("C99999999")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_parser_small_chunks_match_whole_page(scraper, chunk_size):
+    data = (FIXTURES / "knapsack_detail.html").read_bytes()
+    expected = scraper.parse_detail(data.decode("utf-8"), "C00000001")
+
+    parser = _DetailPageParser(scraper, "C00000001", encoding="utf-8")
+    for start in range(0, len(data), chunk_size):
+        if parser.feed(data[start:start + chunk_size]):
+            break
+
+    assert parser.close() == expected
+
+
+def test_parser_stops_once_all_fields_are_seen(scraper):
+    html = read_fixture("knapsack_detail.html")
+    head, _, _ = html.partition('<div id="footer">')
+
+    parser = _DetailPageParser(scraper, "C00000001")
+    assert parser.feed(head) is True
+    assert not parser.pending
+
+
+def test_parse_main_table_matches_row_parser(scraper):
+    html = read_fixture("knapsack_results.html")
+
+    df = scraper.parse_main_table(html)
+    fallback = scraper._parse_main_table_rows(html)
+
+    assert list(df.columns) == ["C_ID", "CAS_ID", "Metabolite", "Molecular_Formula", "Mw",
+                                "Organism or InChIKey etc."]
+    assert list(df["C_ID"]) == ["C00000001", "C00000002"]
+    # Cells stay text, so zeros in CAS IDs and masses are not dropped
+    assert list(df["CAS_ID"]) == ["50-78-2", "0064-17-5"]
+    assert list(df["Mw"]) == ["180.0420", "46.0419"]
+    assert df.loc[1, "Metabolite"] == "Ethanol & co"
+    pd.testing.assert_frame_equal(df, fallback)
+
+
+def test_parse_main_table_without_table(scraper):
+    assert scraper.parse_main_table("<html><body><p>No results</p></body></html>").empty
@@ -0,0 +1,60 @@
+"""
+Tests for the Molsoft result page parser, run against a saved HTML fixture.
+"""
+
+import pathlib
+
+import pytest
+
+from BioChem.scrapers import molsoft
+from BioChem.scrapers.molsoft import MolsoftScraper
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+
+EXPECTED = {
+    "SMILES": "CC(=O)Oc1ccccc1C(=O)O",
+    "Molecular formula": "C9 H8 O4",
+    "Molecular weight": "180.04",
+    "HBA": "4",
+    "HBD": "1",
+    "MolLogP": "1.24",
+    "MolLogS": "-1.73",
+    "MolPSA": "50.32 A",
+    "MolVol": "167.52 A",
+    "pKa": "< 0. / 3.72",
+    "BBB Score": "3.57",
+    "Number of stereo centers": "0",
+}
+
+
+@pytest.fixture
+def scraper():
+    scraper = MolsoftScraper()
+    yield scraper
+    scraper.close()
+
+
+@pytest.fixture
+def html():
+    return (FIXTURES / "molsoft_result.html").read_text(encoding="utf-8")
+
+
+def test_parse_html(scraper, html):
+    data = scraper.parse_html(html, EXPECTED["SMILES"])
+
+    assert {key: data.get(key) for key in EXPECTED} == EXPECTED
+
+
+def test_label_regex_unescapes_and_handles_attributes(scraper):
+    labels = scraper.extract_labels('<B class="x">A &amp; B:</B > one<br><b>Empty:</b><br>')
+
+    assert labels == [("A & B:", " one"), ("Empty:", None)]
+
+
+def test_tree_fallbacks_match_regex(scraper, html, monkeypatch):
+    expected = scraper.parse_html(html, EXPECTED["SMILES"])
+    monkeypatch.setattr(molsoft, "_LABEL_RE", molsoft.re.compile(r"(?!)()()"))
+
+    assert scraper.parse_html(html, EXPECTED["SMILES"]) == expected
+    monkeypatch.setattr(molsoft, "LexborHTMLParser", None)
+    assert scraper.parse_html(html, EXPECTED["SMILES"]) == expected